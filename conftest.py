@@ -0,0 +1,50 @@
+"""
+Shared pytest fixtures for the AI agent test suites.
+
+Each agent module is constructed once per test session and handed to the
+tests that need it, instead of every test building its own copy.
+"""
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def task_manager():
+    """Task manager shared by the session; its scheduler is stopped at the end."""
+    from modules.task_management import TaskManager
+
+    task_manager = TaskManager()
+    yield task_manager
+    task_manager.shutdown()
+
+
+@pytest.fixture(scope="session")
+def planning_module():
+    """Planning and analysis module shared by the session."""
+    from modules.planning_analysis import PlanningAnalysisModule
+
+    return PlanningAnalysisModule()
+
+
+@pytest.fixture(scope="session")
+def dev_module():
+    """Development and creation module shared by the session."""
+    from modules.dev_creation import DevelopmentCreationModule
+
+    return DevelopmentCreationModule()
+
+
+@pytest.fixture(scope="session")
+def deploy_module():
+    """Deployment management module shared by the session."""
+    from modules.deploy_management import DeploymentManagementModule
+
+    return DeploymentManagementModule()
+
+
+@pytest.fixture(scope="session")
+def version_control():
+    """Version control module for the repository the tests run in."""
+    from modules.version_control import VersionControlModule
+
+    return VersionControlModule()
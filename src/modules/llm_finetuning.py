@@ -41,6 +41,14 @@ class LLMFineTuningModule:
         self.fine_tuning_jobs = {}
         self.fine_tuned_models = {}
         
+        # Running usage counters, kept in sync with job status transitions
+        self._stats = {
+            "successful_jobs": 0,
+            "failed_jobs": 0,
+            "active_jobs": 0,
+            "total_tokens_trained": 0
+        }
+        
         logger.info("LLM Fine-Tuning Module initialized")
     
     def prepare_training_data(self, data: List[Dict[str, Any]], output_file: str, format_type: str = "chat") -> str:
@@ -244,6 +252,7 @@ class LLMFineTuningModule:
                 "hyperparameters": hyperparameters,
                 "suffix": suffix
             }
+            self._update_job_stats(self.fine_tuning_jobs[job_id], 1)
             
             logger.info(f"Fine-tuning job created successfully. Job ID: {job_id}")
             return job_id
@@ -280,7 +289,10 @@ class LLMFineTuningModule:
             
             # Update local storage
             if job_id in self.fine_tuning_jobs:
-                self.fine_tuning_jobs[job_id].update(status_info)
+                job_info = self.fine_tuning_jobs[job_id]
+                self._update_job_stats(job_info, -1)
+                job_info.update(status_info)
+                self._update_job_stats(job_info, 1)
             
             return status_info
             
@@ -462,7 +474,10 @@ class LLMFineTuningModule:
             response = self.client.fine_tuning.jobs.cancel(job_id)
             
             if job_id in self.fine_tuning_jobs:
-                self.fine_tuning_jobs[job_id]["status"] = "cancelled"
+                job_info = self.fine_tuning_jobs[job_id]
+                self._update_job_stats(job_info, -1)
+                job_info["status"] = "cancelled"
+                self._update_job_stats(job_info, 1)
             
             logger.info(f"Fine-tuning job cancelled: {job_id}")
             return response.status == "cancelled"
@@ -501,27 +516,31 @@ class LLMFineTuningModule:
         Returns:
             Usage statistics
         """
-        stats = {
+        return {
             "total_jobs": len(self.fine_tuning_jobs),
-            "successful_jobs": 0,
-            "failed_jobs": 0,
-            "active_jobs": 0,
+            "successful_jobs": self._stats["successful_jobs"],
+            "failed_jobs": self._stats["failed_jobs"],
+            "active_jobs": self._stats["active_jobs"],
             "total_models": len(self.fine_tuned_models),
-            "total_tokens_trained": 0
+            "total_tokens_trained": self._stats["total_tokens_trained"]
         }
+    
+    def _update_job_stats(self, job_info: Dict[str, Any], sign: int):
+        """
+        Add (sign=1) or remove (sign=-1) a job's contribution to the usage counters.
         
-        for job_info in self.fine_tuning_jobs.values():
-            status = job_info.get("status", "unknown")
-            if status == "succeeded":
-                stats["successful_jobs"] += 1
-            elif status == "failed":
-                stats["failed_jobs"] += 1
-            elif status in ["running", "pending"]:
-                stats["active_jobs"] += 1
-            
-            trained_tokens = job_info.get("trained_tokens", 0)
-            if trained_tokens:
-                stats["total_tokens_trained"] += trained_tokens
-        
-        return stats
-
+        Args:
+            job_info: Locally stored job information
+            sign: 1 to count the job, -1 to uncount it before a status change
+        """
+        status = job_info.get("status", "unknown")
+        if status == "succeeded":
+            self._stats["successful_jobs"] += sign
+        elif status == "failed":
+            self._stats["failed_jobs"] += sign
+        elif status in ["running", "pending"]:
+            self._stats["active_jobs"] += sign
+        
+        trained_tokens = job_info.get("trained_tokens", 0)
+        if trained_tokens:
+            self._stats["total_tokens_trained"] += sign * trained_tokens
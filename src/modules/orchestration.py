@@ -3,6 +3,7 @@ Orchestration Layer - Central coordination for the AI Agent
 Manages task flow, module coordination, and overall workflow execution.
 """
 
+import sys
 import uuid
 import json
 import logging
@@ -18,6 +19,24 @@ class TaskStatus(Enum):
     FAILED = "failed"
     CANCELLED = "cancelled"
 
+# Interned status strings stored on task dicts, so status writes skip the
+# enum descriptor lookup and comparisons against them are identity checks.
+STATUS_CREATED = sys.intern(TaskStatus.CREATED.value)
+STATUS_PLANNING = sys.intern(TaskStatus.PLANNING.value)
+STATUS_IN_PROGRESS = sys.intern(TaskStatus.IN_PROGRESS.value)
+STATUS_COMPLETED = sys.intern(TaskStatus.COMPLETED.value)
+STATUS_FAILED = sys.intern(TaskStatus.FAILED.value)
+STATUS_CANCELLED = sys.intern(TaskStatus.CANCELLED.value)
+
+_STATUS_STRINGS = {
+    TaskStatus.CREATED: STATUS_CREATED,
+    TaskStatus.PLANNING: STATUS_PLANNING,
+    TaskStatus.IN_PROGRESS: STATUS_IN_PROGRESS,
+    TaskStatus.COMPLETED: STATUS_COMPLETED,
+    TaskStatus.FAILED: STATUS_FAILED,
+    TaskStatus.CANCELLED: STATUS_CANCELLED
+}
+
 class TaskType(Enum):
     WEBSITE_CREATION = "website_creation"
     APP_DEVELOPMENT = "app_development"
@@ -65,7 +84,7 @@ class OrchestrationLayer:
             'description': description,
             'type': task_type,
             'priority': priority,
-            'status': TaskStatus.CREATED.value,
+            'status': STATUS_CREATED,
             'created_at': datetime.now().isoformat(),
             'updated_at': datetime.now().isoformat(),
             'metadata': metadata or {},
@@ -214,7 +233,7 @@ class OrchestrationLayer:
     def _update_task_status(self, task_id: str, status: TaskStatus):
         """Update task status."""
         if task_id in self.tasks:
-            self.tasks[task_id]['status'] = status.value
+            self.tasks[task_id]['status'] = _STATUS_STRINGS[status]
             self.tasks[task_id]['updated_at'] = datetime.now().isoformat()
     
     def _update_task_progress(self, task_id: str, progress: int):
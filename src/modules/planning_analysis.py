@@ -4,13 +4,160 @@ Handles requirement analysis, project planning, and data analysis tasks.
 """
 
 import os
+import re
 import json
 import logging
+import functools
 import subprocess
-from typing import Dict, Any, List, Optional
+from collections import namedtuple
+from typing import Dict, Any, List, Optional, Final
 from datetime import datetime
 import requests
 
+def _alternation(words) -> str:
+    """Join words into a regex alternation, longest first so longer words win."""
+    return '|'.join(re.escape(w) for w in sorted(words, key=len, reverse=True))
+
+def _build_marker_pattern(markers) -> re.Pattern:
+    """Compile markers into one pattern that finds every (overlapping) substring hit in a single scan."""
+    return re.compile(f'(?=({_alternation(markers)}))')
+
+# Trigger words for each requirement tag, matched as substrings of the description
+# (so 'websites' still triggers 'website' and 'webapp' triggers 'web')
+_FUNCTIONAL_TRIGGERS = {
+    'web_interface': frozenset({'website', 'web', 'site'}),
+    'backend_api': frozenset({'api', 'backend', 'server'}),
+    'data_storage': frozenset({'database', 'data', 'storage'}),
+    'responsive_design': frozenset({'responsive', 'mobile'})
+}
+
+_TECHNICAL_TRIGGERS = {
+    'frontend_framework': frozenset({'react', 'vue', 'angular'}),
+    'python_backend': frozenset({'python', 'flask', 'django'}),
+    'deployment': frozenset({'deploy', 'hosting', 'cloud'})
+}
+
+_CONSTRAINT_TRIGGERS = {
+    'time_sensitive': frozenset({'fast', 'quick', 'urgent'}),
+    'minimal_complexity': frozenset({'simple', 'basic', 'minimal'})
+}
+
+# Substring markers that route a general task to research or planning
+_RESEARCH_MARKERS = frozenset({'analyze', 'research', 'study'})
+_PLANNING_MARKERS = frozenset({'plan', 'organize', 'schedule'})
+
+# Time multiplier applied to the base estimate for each complexity level
+_RESOURCE_MULTIPLIERS: Final[Dict[str, float]] = {
+    'simple': 1.0,
+    'medium': 1.5,
+    'complex': 2.5
+}
+
+# Complexity level markers (checked in order) and feature markers
+_COMPLEXITY_INDICATORS: Final[Dict[str, frozenset]] = {
+    'simple': frozenset({'basic', 'simple', 'minimal', 'quick'}),
+    'medium': frozenset({'standard', 'typical', 'normal'}),
+    'complex': frozenset({'advanced', 'complex', 'comprehensive', 'full-featured'})
+}
+
+_COMPLEXITY_FEATURES: Final[frozenset] = frozenset({'authentication', 'database', 'api', 'responsive', 'admin', 'payment'})
+
+def _trigger_words(*trigger_groups):
+    """Collect every trigger word from the given tag-to-words dicts."""
+    return {w for triggers in trigger_groups for words in triggers.values() for w in words}
+
+# One scan finds every substring hit used by requirement matching, complexity
+# scoring and general task routing
+_MARKER_PATTERN = _build_marker_pattern(
+    _trigger_words(_FUNCTIONAL_TRIGGERS, _TECHNICAL_TRIGGERS, _CONSTRAINT_TRIGGERS, _COMPLEXITY_INDICATORS)
+    | _COMPLEXITY_FEATURES | _RESEARCH_MARKERS | _PLANNING_MARKERS
+)
+
+# Everything the analysis steps need from one description, computed once
+Described = namedtuple('Described', ['lower', 'hits'])
+
+@functools.lru_cache(maxsize=2048)
+def _describe_text(description: str) -> Described:
+    """Lowercase and marker-scan a description; memoized per distinct text."""
+    lower = description.lower()
+    return Described(lower, frozenset(_MARKER_PATTERN.findall(lower)))
+
+def _match_requirements(described: Described) -> tuple:
+    """
+    Match requirement triggers against a described task.
+    
+    Returns:
+        Tuple of (functional, technical, constraints) tuples
+    """
+    hits = described.hits
+    
+    def match(triggers):
+        return tuple(tag for tag, words in triggers.items() if not words.isdisjoint(hits))
+    
+    return (
+        match(_FUNCTIONAL_TRIGGERS),
+        match(_TECHNICAL_TRIGGERS),
+        match(_CONSTRAINT_TRIGGERS)
+    )
+
+def _score_complexity(described: Described) -> tuple:
+    """
+    Estimate complexity from a described task.
+    
+    Returns:
+        Tuple of (complexity, feature_count)
+    """
+    hits = described.hits
+    
+    complexity = 'medium'  # default
+    
+    for level, indicators in _COMPLEXITY_INDICATORS.items():
+        if not hits.isdisjoint(indicators):
+            complexity = level
+            break
+    
+    # Estimate based on features mentioned
+    feature_count = len(hits & _COMPLEXITY_FEATURES)
+    
+    if feature_count > 3:
+        complexity = 'complex'
+    elif feature_count > 1:
+        complexity = 'medium'
+    
+    return complexity, feature_count
+
+@functools.lru_cache(maxsize=None)
+def _estimated_time(minutes: str) -> Dict[str, Any]:
+    """
+    Build the estimated time fields of a plan step.
+    
+    The result is cached and shared, so callers must copy it (steps unpack it with **).
+    
+    Args:
+        minutes: Minutes as a single value ("15") or a range ("30-60")
+    
+    Returns:
+        Dict with the display string and its midpoint in minutes
+    """
+    if '-' in minutes:
+        min_time, max_time = minutes.split('-')
+        avg_time = (int(min_time) + int(max_time)) // 2
+    else:
+        avg_time = int(minutes)
+    
+    return {
+        'estimated_time': f"{minutes} minutes",
+        'estimated_time_minutes': avg_time
+    }
+
+def _join_names(names: List[str]) -> str:
+    """Join technology names for a step description, skipping the join for a single name."""
+    return names[0] if len(names) == 1 else ', '.join(names)
+
+def clear_analysis_cache():
+    """Clear the memoized description analysis results."""
+    _describe_text.cache_clear()
+
 class PlanningAnalysisModule:
     """
     Module responsible for analyzing requirements and creating execution plans.
@@ -39,11 +186,14 @@ class PlanningAnalysisModule:
         """
         self.logger.info(f"Analyzing task: {task['description']}")
         
+        # Lowercase and scan the description once for every analysis step
+        described = self._describe(task)
+        
         # Parse requirements from task description
-        requirements = self._parse_requirements(task['description'])
+        requirements = self._parse_requirements(task['description'], described)
         
         # Determine task complexity and type
-        task_analysis = self._analyze_task_complexity(task)
+        task_analysis = self._analyze_task_complexity(task, described)
         
         # Select appropriate technologies and tools
         tech_stack = self._select_technologies(requirements, task['type'])
@@ -102,89 +252,50 @@ class PlanningAnalysisModule:
         self.logger.info("Executing general task")
         
         # Analyze what the task is asking for
-        requirements = self._parse_requirements(task['description'])
+        described = self._describe(task)
+        requirements = self._parse_requirements(task['description'], described)
         
         # Determine the best approach
-        if any(keyword in task['description'].lower() for keyword in ['analyze', 'research', 'study']):
+        hits = described.hits
+        if not hits.isdisjoint(_RESEARCH_MARKERS):
             return self._web_research(task['description'])
-        elif any(keyword in task['description'].lower() for keyword in ['plan', 'organize', 'schedule']):
+        elif not hits.isdisjoint(_PLANNING_MARKERS):
             return self._create_planning_document(task)
         else:
             return self._create_general_response(task)
     
-    def _parse_requirements(self, description: str) -> Dict[str, Any]:
-        """Parse requirements from natural language description."""
-        requirements = {
-            'functional': [],
-            'technical': [],
-            'constraints': [],
-            'keywords': []
-        }
-        
-        # Extract keywords
-        keywords = description.lower().split()
-        requirements['keywords'] = keywords
-        
-        # Identify functional requirements
-        if any(word in description.lower() for word in ['website', 'web', 'site']):
-            requirements['functional'].append('web_interface')
-        
-        if any(word in description.lower() for word in ['api', 'backend', 'server']):
-            requirements['functional'].append('backend_api')
-        
-        if any(word in description.lower() for word in ['database', 'data', 'storage']):
-            requirements['functional'].append('data_storage')
-        
-        if any(word in description.lower() for word in ['responsive', 'mobile']):
-            requirements['functional'].append('responsive_design')
-        
-        # Identify technical requirements
-        if any(word in description.lower() for word in ['react', 'vue', 'angular']):
-            requirements['technical'].append('frontend_framework')
-        
-        if any(word in description.lower() for word in ['python', 'flask', 'django']):
-            requirements['technical'].append('python_backend')
-        
-        if any(word in description.lower() for word in ['deploy', 'hosting', 'cloud']):
-            requirements['technical'].append('deployment')
-        
-        # Identify constraints
-        if any(word in description.lower() for word in ['fast', 'quick', 'urgent']):
-            requirements['constraints'].append('time_sensitive')
-        
-        if any(word in description.lower() for word in ['simple', 'basic', 'minimal']):
-            requirements['constraints'].append('minimal_complexity')
+    def _describe(self, task: Dict[str, Any]) -> Described:
+        """
+        Get the lowercased text and marker hits of a task's description.
         
-        return requirements
+        The cache is keyed on the description text itself rather than stored on
+        the task, so editing task['description'] is picked up and task dicts
+        (which are returned by the API) stay free of private keys.
+        """
+        return _describe_text(task['description'])
     
-    def _analyze_task_complexity(self, task: Dict[str, Any]) -> Dict[str, Any]:
-        """Analyze task complexity and characteristics."""
-        description = task['description'].lower()
+    def _parse_requirements(self, description: str,
+                            described: Optional[Described] = None) -> Dict[str, Any]:
+        """Parse requirements from natural language description."""
+        functional, technical, constraints = _match_requirements(
+            described or _describe_text(description)
+        )
         
-        complexity_indicators = {
-            'simple': ['basic', 'simple', 'minimal', 'quick'],
-            'medium': ['standard', 'typical', 'normal'],
-            'complex': ['advanced', 'complex', 'comprehensive', 'full-featured']
+        # Fresh lists so callers can extend the result without touching the cache
+        return {
+            'functional': list(functional),
+            'technical': list(technical),
+            'constraints': list(constraints)
         }
-        
-        complexity = 'medium'  # default
-        
-        for level, indicators in complexity_indicators.items():
-            if any(indicator in description for indicator in indicators):
-                complexity = level
-                break
-        
-        # Estimate based on features mentioned
-        feature_count = 0
-        features = ['authentication', 'database', 'api', 'responsive', 'admin', 'payment']
-        for feature in features:
-            if feature in description:
-                feature_count += 1
-        
-        if feature_count > 3:
-            complexity = 'complex'
-        elif feature_count > 1:
-            complexity = 'medium'
+    
+    def get_keywords(self, description: str) -> List[str]:
+        """Split a description into lowercase keywords, for callers that need them."""
+        return _describe_text(description).lower.split()
+    
+    def _analyze_task_complexity(self, task: Dict[str, Any],
+                                 described: Optional[Described] = None) -> Dict[str, Any]:
+        """Analyze task complexity and characteristics."""
+        complexity, feature_count = _score_complexity(described or self._describe(task))
         
         return {
             'complexity': complexity,
@@ -238,73 +349,51 @@ class PlanningAnalysisModule:
         """Create a detailed project execution plan."""
         steps = []
         
+        def add_step(phase, title, description, minutes, dependencies):
+            """Append the next numbered step and return its step number."""
+            step_num = len(steps) + 1
+            steps.append({
+                'phase': phase,
+                'step': step_num,
+                'title': title,
+                'description': description,
+                **_estimated_time(minutes),
+                'dependencies': dependencies
+            })
+            return step_num
+        
         # Planning phase
-        steps.append({
-            'phase': 'planning',
-            'step': 1,
-            'title': 'Project Setup',
-            'description': 'Initialize project structure and dependencies',
-            'estimated_time': '15 minutes',
-            'dependencies': []
-        })
+        setup_step = add_step('planning', 'Project Setup',
+                              'Initialize project structure and dependencies', '15', [])
         
         # Development phases based on tech stack
-        step_num = 2
+        backend_step = None
         
         if tech_stack['backend']:
-            steps.append({
-                'phase': 'development',
-                'step': step_num,
-                'title': 'Backend Development',
-                'description': f"Implement backend using {', '.join(tech_stack['backend'])}",
-                'estimated_time': '30-60 minutes',
-                'dependencies': [1]
-            })
-            step_num += 1
+            backend_step = add_step('development', 'Backend Development',
+                                    f"Implement backend using {_join_names(tech_stack['backend'])}",
+                                    '30-60', [setup_step])
         
         if tech_stack['frontend']:
-            steps.append({
-                'phase': 'development',
-                'step': step_num,
-                'title': 'Frontend Development',
-                'description': f"Create frontend using {', '.join(tech_stack['frontend'])}",
-                'estimated_time': '30-45 minutes',
-                'dependencies': [1]
-            })
-            step_num += 1
+            add_step('development', 'Frontend Development',
+                     f"Create frontend using {_join_names(tech_stack['frontend'])}",
+                     '30-45', [setup_step])
         
         if tech_stack['database']:
-            steps.append({
-                'phase': 'development',
-                'step': step_num,
-                'title': 'Database Integration',
-                'description': f"Set up database using {', '.join(tech_stack['database'])}",
-                'estimated_time': '15-30 minutes',
-                'dependencies': [2] if tech_stack['backend'] else [1]
-            })
-            step_num += 1
+            add_step('development', 'Database Integration',
+                     f"Set up database using {_join_names(tech_stack['database'])}",
+                     '15-30', [backend_step or setup_step])
         
         # Testing phase
-        steps.append({
-            'phase': 'testing',
-            'step': step_num,
-            'title': 'Testing and Validation',
-            'description': 'Test functionality and fix issues',
-            'estimated_time': '15-30 minutes',
-            'dependencies': list(range(1, step_num))
-        })
-        step_num += 1
+        testing_step = add_step('testing', 'Testing and Validation',
+                                'Test functionality and fix issues',
+                                '15-30', list(range(1, len(steps) + 1)))
         
         # Deployment phase
         if tech_stack['deployment']:
-            steps.append({
-                'phase': 'deployment',
-                'step': step_num,
-                'title': 'Deployment',
-                'description': f"Deploy using {', '.join(tech_stack['deployment'])}",
-                'estimated_time': '10-20 minutes',
-                'dependencies': [step_num - 1]
-            })
+            add_step('deployment', 'Deployment',
+                     f"Deploy using {_join_names(tech_stack['deployment'])}",
+                     '10-20', [testing_step])
         
         return {
             'steps': steps,
@@ -317,14 +406,8 @@ class PlanningAnalysisModule:
         """Estimate resources needed for the project."""
         complexity = execution_plan['complexity']
         
-        resource_multipliers = {
-            'simple': 1.0,
-            'medium': 1.5,
-            'complex': 2.5
-        }
-        
         base_time = 60  # minutes
-        multiplier = resource_multipliers.get(complexity, 1.5)
+        multiplier = _RESOURCE_MULTIPLIERS.get(complexity, 1.5)
         
         return {
             'estimated_time_minutes': int(base_time * multiplier),
@@ -335,20 +418,7 @@ class PlanningAnalysisModule:
     
     def _calculate_total_time(self, steps: List[Dict[str, Any]]) -> str:
         """Calculate total estimated time from steps."""
-        total_minutes = 0
-        
-        for step in steps:
-            time_str = step['estimated_time']
-            # Extract minutes from time string (e.g., "30-60 minutes" -> 45)
-            if '-' in time_str:
-                times = time_str.split('-')
-                min_time = int(times[0])
-                max_time = int(times[1].split()[0])
-                avg_time = (min_time + max_time) // 2
-            else:
-                avg_time = int(time_str.split()[0])
-            
-            total_minutes += avg_time
+        total_minutes = sum(step['estimated_time_minutes'] for step in steps)
         
         hours = total_minutes // 60
         minutes = total_minutes % 60
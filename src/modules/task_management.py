@@ -4,31 +4,90 @@ Handles task queuing, scheduling, prioritization, and lifecycle management.
 """
 
 import json
+import time
+import heapq
 import logging
+import itertools
 import threading
 from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional
-from queue import PriorityQueue
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, field
 from enum import Enum
 
+try:
+    import orjson  # Optional C JSON encoder used to speed up export_tasks
+except ImportError:
+    orjson = None
+
 class Priority(Enum):
     LOW = 3
     MEDIUM = 2
     HIGH = 1
 
-@dataclass
+# Lifecycle states tracked by TaskManager's status index
+TASK_STATUSES = ('queued', 'scheduled', 'active', 'completed', 'failed')
+
+# Metadata keys holding epoch timestamps set by the task lifecycle
+_METADATA_TIMESTAMPS = ('completed_at', 'failed_at')
+
+def _to_timestamp(value) -> Optional[float]:
+    """Convert an ISO string (or epoch number) to epoch seconds; None stays None."""
+    if value is None or isinstance(value, float):
+        return value
+    if isinstance(value, str):
+        return datetime.fromisoformat(value).timestamp()
+    return float(value)
+
+def _format_timestamp(value: Optional[float]) -> Optional[str]:
+    """Format epoch seconds as an ISO string; None stays None."""
+    return None if value is None else datetime.fromtimestamp(value).isoformat()
+
+@dataclass(slots=True)
 class Task:
     id: str
     description: str
     type: str
     priority: int
-    created_at: str
-    scheduled_at: Optional[str] = None
+    created_at: float  # Epoch seconds; formatted to ISO only on export
+    scheduled_at: Optional[float] = None
     metadata: Dict[str, Any] = None
+    status: str = field(default='queued')
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Return a shallow dict of the task fields (cheaper than dataclasses.asdict).
+        
+        Timestamps are formatted as ISO strings, matching the export format.
+        """
+        metadata = self.metadata
+        if metadata and any(key in metadata for key in _METADATA_TIMESTAMPS):
+            metadata = dict(metadata)
+            for key in _METADATA_TIMESTAMPS:
+                if key in metadata:
+                    metadata[key] = _format_timestamp(_to_timestamp(metadata[key]))
+        
+        return {
+            'id': self.id,
+            'description': self.description,
+            'type': self.type,
+            'priority': self.priority,
+            'created_at': _format_timestamp(self.created_at),
+            'scheduled_at': _format_timestamp(self.scheduled_at),
+            'metadata': metadata,
+            'status': self.status
+        }
     
-    def __lt__(self, other):
-        return self.priority < other.priority
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Task':
+        """Build a task from a to_dict()/export dict, parsing its timestamps."""
+        task = cls(**data)
+        task.created_at = _to_timestamp(task.created_at)
+        task.scheduled_at = _to_timestamp(task.scheduled_at)
+        if task.metadata:
+            for key in _METADATA_TIMESTAMPS:
+                if key in task.metadata:
+                    task.metadata[key] = _to_timestamp(task.metadata[key])
+        return task
 
 class TaskManager:
     """
@@ -36,11 +95,23 @@ class TaskManager:
     """
     
     def __init__(self):
-        self.task_queue = PriorityQueue()
-        self.scheduled_tasks = {}
-        self.active_tasks = {}
-        self.completed_tasks = {}
-        self.failed_tasks = {}
+        # Priority heap of (priority, sequence, task) entries; the unique sequence
+        # number keeps equal priorities FIFO and means tasks are never compared
+        self._heap = []
+        self._counter = itertools.count()
+        self._heap_lock = threading.Lock()
+        # All known tasks by id, plus the ids in each lifecycle state; every read
+        # and write of the pair goes through _index_lock (always taken last)
+        self.tasks = {}
+        self._by_status = {status: set() for status in TASK_STATUSES}
+        self._index_lock = threading.RLock()
+        # Min-heap of (scheduled epoch timestamp, sequence, task) for the scheduler;
+        # entries hold the task itself so a stale entry never matches a re-added id
+        self._schedule_heap = []
+        # Guards the schedule heap; notified on new entries and on shutdown
+        self._sched_cv = threading.Condition()
+        # Export views of completed/failed tasks, built once on the terminal transition
+        self._serialized_tasks = {}
         self.logger = logging.getLogger(__name__)
         
         # Start scheduler thread
@@ -74,18 +145,19 @@ class TaskManager:
             description=task_data['description'],
             type=task_data['type'],
             priority=priority,
-            created_at=task_data['created_at'],
-            scheduled_at=task_data.get('scheduled_at'),
+            created_at=_to_timestamp(task_data['created_at']),
+            scheduled_at=_to_timestamp(task_data.get('scheduled_at')),
             metadata=task_data.get('metadata', {})
         )
         
         if task.scheduled_at:
             # Schedule for later execution
-            self.scheduled_tasks[task.id] = task
-            self.logger.info(f"Scheduled task {task.id} for {task.scheduled_at}")
+            self._schedule(task)
+            self.logger.info(f"Scheduled task {task.id} for {_format_timestamp(task.scheduled_at)}")
         else:
             # Add to immediate execution queue
-            self.task_queue.put(task)
+            self._set_status(task, 'queued')
+            self._push_task(task)
             self.logger.info(f"Added task {task.id} to queue with priority {priority}")
         
         return task.id
@@ -97,12 +169,101 @@ class TaskManager:
         Returns:
             Task object or None if queue is empty
         """
-        if not self.task_queue.empty():
-            task = self.task_queue.get()
-            self.active_tasks[task.id] = task
-            self.logger.info(f"Retrieved task {task.id} from queue")
-            return task
-        return None
+        with self._heap_lock:
+            while self._heap:
+                _, _, task = heapq.heappop(self._heap)
+                # Cancelled tasks are left in the heap and dropped here (lazy deletion)
+                if self._transition(task, 'queued', 'active'):
+                    break
+            else:
+                return None
+        
+        self.logger.info(f"Retrieved task {task.id} from queue")
+        return task
+    
+    def _schedule(self, task: Task):
+        """
+        Register a task for later execution, indexed by its scheduled time.
+        
+        Args:
+            task: Task with a scheduled_at timestamp
+        """
+        with self._sched_cv:
+            self._set_status(task, 'scheduled')
+            heapq.heappush(self._schedule_heap, (task.scheduled_at, next(self._counter), task))
+            # Wake the scheduler so it can recompute its next wake-up time
+            self._sched_cv.notify()
+    
+    def _set_status(self, task: Task, status: str):
+        """
+        Register a task and move it to a new lifecycle state in the status index.
+        
+        Args:
+            task: Task to update
+            status: New status, one of TASK_STATUSES
+        """
+        with self._index_lock:
+            existing = self.tasks.get(task.id)
+            if existing is not None:
+                self._by_status[existing.status].discard(task.id)
+            self.tasks[task.id] = task
+            task.status = status
+            self._by_status[status].add(task.id)
+    
+    def _transition(self, task: Task, from_status: str, to_status: str) -> bool:
+        """
+        Atomically move a task between states if it is still registered in from_status.
+        
+        Args:
+            task: Task to update
+            from_status: Status the task must currently have
+            to_status: New status, one of TASK_STATUSES
+            
+        Returns:
+            bool: True if the task was moved, False if it had changed meanwhile
+        """
+        with self._index_lock:
+            if self.tasks.get(task.id) is not task or task.status != from_status:
+                return False
+            self._set_status(task, to_status)
+            return True
+    
+    def _remove_task(self, task_id: str):
+        """
+        Drop a task from the table and status index, marking it cancelled.
+        
+        Heap entries still referencing the task are discarded lazily when popped.
+        
+        Args:
+            task_id: Task identifier
+        """
+        with self._index_lock:
+            task = self.tasks.pop(task_id)
+            self._by_status[task.status].discard(task_id)
+            task.status = 'cancelled'
+    
+    def _tasks_with_status(self, status: str) -> Dict[str, Task]:
+        """
+        Get the tasks currently in a lifecycle state.
+        
+        Args:
+            status: One of TASK_STATUSES
+            
+        Returns:
+            Dictionary of task ID to Task
+        """
+        with self._index_lock:
+            return {task_id: self.tasks[task_id] for task_id in self._by_status[status]}
+    
+    def _push_task(self, task: Task):
+        """
+        Push a task onto the priority heap.
+        
+        Args:
+            task: Task to enqueue
+        """
+        with self._heap_lock:
+            heapq.heappush(self._heap, (task.priority, next(self._counter), task))
     
     def complete_task(self, task_id: str, result: Dict[str, Any] = None):
         """
@@ -112,12 +273,15 @@ class TaskManager:
             task_id: Task identifier
             result: Task execution result
         """
-        if task_id in self.active_tasks:
-            task = self.active_tasks.pop(task_id)
+        with self._index_lock:
+            task = self.tasks.get(task_id)
+            if task is None or task.status != 'active':
+                return
             task.metadata['result'] = result
-            task.metadata['completed_at'] = datetime.now().isoformat()
-            self.completed_tasks[task_id] = task
-            self.logger.info(f"Task {task_id} completed")
+            task.metadata['completed_at'] = time.time()
+            self._set_status(task, 'completed')
+            self._serialized_tasks[task_id] = task.to_dict()
+        self.logger.info(f"Task {task_id} completed")
     
     def fail_task(self, task_id: str, error: str):
         """
@@ -127,12 +291,15 @@ class TaskManager:
             task_id: Task identifier
             error: Error message
         """
-        if task_id in self.active_tasks:
-            task = self.active_tasks.pop(task_id)
+        with self._index_lock:
+            task = self.tasks.get(task_id)
+            if task is None or task.status != 'active':
+                return
             task.metadata['error'] = error
-            task.metadata['failed_at'] = datetime.now().isoformat()
-            self.failed_tasks[task_id] = task
-            self.logger.error(f"Task {task_id} failed: {error}")
+            task.metadata['failed_at'] = time.time()
+            self._set_status(task, 'failed')
+            self._serialized_tasks[task_id] = task.to_dict()
+        self.logger.error(f"Task {task_id} failed: {error}")
     
     def schedule_task(self, task_data: Dict[str, Any], scheduled_time: datetime) -> str:
         """
@@ -158,18 +325,23 @@ class TaskManager:
         Returns:
             bool: True if task was cancelled, False if not found
         """
-        # Check scheduled tasks
-        if task_id in self.scheduled_tasks:
-            del self.scheduled_tasks[task_id]
-            self.logger.info(f"Cancelled scheduled task {task_id}")
+        # Look up and remove under the index lock so the scheduler or a consumer
+        # cannot move the task in between; heap entries are skipped when popped
+        with self._index_lock:
+            task = self.tasks.get(task_id)
+            status = task.status if task is not None else None
+            if status in ('scheduled', 'queued'):
+                self._remove_task(task_id)
+        
+        if status in ('scheduled', 'queued'):
+            self.logger.info(f"Cancelled {status} task {task_id}")
             return True
         
         # Check active tasks (cannot cancel)
-        if task_id in self.active_tasks:
+        if status == 'active':
             self.logger.warning(f"Cannot cancel active task {task_id}")
             return False
         
-        # Check queue (more complex, would need to rebuild queue)
         self.logger.warning(f"Task {task_id} not found for cancellation")
         return False
     
@@ -180,13 +352,8 @@ class TaskManager:
         Returns:
             Dictionary with task counts
         """
-        return {
-            'queued': self.task_queue.qsize(),
-            'scheduled': len(self.scheduled_tasks),
-            'active': len(self.active_tasks),
-            'completed': len(self.completed_tasks),
-            'failed': len(self.failed_tasks)
-        }
+        with self._index_lock:
+            return {status: len(task_ids) for status, task_ids in self._by_status.items()}
     
     def get_queue_status(self) -> List[Dict[str, Any]]:
         """
@@ -195,12 +362,11 @@ class TaskManager:
         Returns:
             List of queued tasks
         """
-        # Note: This is a simplified view as PriorityQueue doesn't allow peeking
         return [
             {
-                'queue_size': self.task_queue.qsize(),
-                'scheduled_count': len(self.scheduled_tasks),
-                'active_count': len(self.active_tasks)
+                'queue_size': len(self._by_status['queued']),
+                'scheduled_count': len(self._by_status['scheduled']),
+                'active_count': len(self._by_status['active'])
             }
         ]
     
@@ -210,34 +376,45 @@ class TaskManager:
         """
         while self.scheduler_running:
             try:
-                current_time = datetime.now()
-                tasks_to_queue = []
+                now = time.time()
+                ready_tasks = []
                 
-                # Check scheduled tasks
-                for task_id, task in self.scheduled_tasks.items():
-                    scheduled_time = datetime.fromisoformat(task.scheduled_at)
-                    if current_time >= scheduled_time:
-                        tasks_to_queue.append(task_id)
+                # Pop only the entries that are due; the heap keeps the earliest first
+                with self._sched_cv:
+                    while self._schedule_heap and self._schedule_heap[0][0] <= now:
+                        _, _, task = heapq.heappop(self._schedule_heap)
+                        # Skip entries of cancelled tasks, even if the id was reused since
+                        if self._transition(task, 'scheduled', 'queued'):
+                            ready_tasks.append(task)
                 
                 # Move ready tasks to queue
-                for task_id in tasks_to_queue:
-                    task = self.scheduled_tasks.pop(task_id)
+                for task in ready_tasks:
                     task.scheduled_at = None  # Clear scheduled time
-                    self.task_queue.put(task)
-                    self.logger.info(f"Moved scheduled task {task_id} to queue")
+                    self._push_task(task)
+                    self.logger.info(f"Moved scheduled task {task.id} to queue")
                 
-                # Sleep for a short interval
-                threading.Event().wait(10)  # Check every 10 seconds
+                # Sleep until the next task is due, a new task is scheduled, or shutdown
+                with self._sched_cv:
+                    if self.scheduler_running:
+                        if self._schedule_heap:
+                            sleep_for = max(0, self._schedule_heap[0][0] - time.time())
+                        else:
+                            sleep_for = 60
+                        self._sched_cv.wait(timeout=sleep_for)
                 
             except Exception as e:
                 self.logger.error(f"Scheduler error: {str(e)}")
-                threading.Event().wait(60)  # Wait longer on error
+                with self._sched_cv:
+                    if self.scheduler_running:
+                        self._sched_cv.wait(timeout=60)  # Wait longer on error
     
     def shutdown(self):
         """
         Shutdown the task manager.
         """
         self.scheduler_running = False
+        with self._sched_cv:
+            self._sched_cv.notify_all()
         if self.scheduler_thread.is_alive():
             self.scheduler_thread.join(timeout=5)
         self.logger.info("Task Manager shutdown")
@@ -249,16 +426,25 @@ class TaskManager:
         Args:
             file_path: Path to save the export file
         """
+        serialized = self._serialized_tasks
         export_data = {
-            'scheduled_tasks': {k: asdict(v) for k, v in self.scheduled_tasks.items()},
-            'active_tasks': {k: asdict(v) for k, v in self.active_tasks.items()},
-            'completed_tasks': {k: asdict(v) for k, v in self.completed_tasks.items()},
-            'failed_tasks': {k: asdict(v) for k, v in self.failed_tasks.items()},
+            'scheduled_tasks': {k: v.to_dict() for k, v in self._tasks_with_status('scheduled').items()},
+            'active_tasks': {k: v.to_dict() for k, v in self._tasks_with_status('active').items()},
+            'completed_tasks': {k: serialized.get(k) or v.to_dict() for k, v in self._tasks_with_status('completed').items()},
+            'failed_tasks': {k: serialized.get(k) or v.to_dict() for k, v in self._tasks_with_status('failed').items()},
             'export_timestamp': datetime.now().isoformat()
         }
         
-        with open(file_path, 'w') as f:
-            json.dump(export_data, f, indent=2)
+        if orjson is not None:
+            with open(file_path, 'wb') as f:
+                f.write(orjson.dumps(
+                    export_data,
+                    default=str,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                ))
+        else:
+            with open(file_path, 'w') as f:
+                json.dump(export_data, f, indent=2, default=str)
         
         self.logger.info(f"Tasks exported to {file_path}")
     
@@ -274,15 +460,15 @@ class TaskManager:
         
         # Restore scheduled tasks
         for task_id, task_data in import_data.get('scheduled_tasks', {}).items():
-            self.scheduled_tasks[task_id] = Task(**task_data)
+            self._schedule(Task.from_dict(task_data))
         
         # Restore completed tasks
         for task_id, task_data in import_data.get('completed_tasks', {}).items():
-            self.completed_tasks[task_id] = Task(**task_data)
+            self._set_status(Task.from_dict(task_data), 'completed')
         
         # Restore failed tasks
         for task_id, task_data in import_data.get('failed_tasks', {}).items():
-            self.failed_tasks[task_id] = Task(**task_data)
+            self._set_status(Task.from_dict(task_data), 'failed')
         
         self.logger.info(f"Tasks imported from {file_path}")
 
@@ -5,12 +5,101 @@ Handles Git operations and GitHub integration for tracking all changes.
 
 import os
 import json
+import asyncio
+import time
+import heapq
 import logging
-import subprocess
-from typing import Dict, Any, List, Optional
-from datetime import datetime
-import git
-from git import Repo, InvalidGitRepositoryError
+import itertools
+from typing import TYPE_CHECKING, Dict, Any, List, Optional
+from datetime import datetime, timedelta, timezone
+
+if TYPE_CHECKING:
+    # GitPython is only imported at runtime when the repository is opened
+    import git
+
+try:
+    import pygit2  # Optional libgit2 bindings used for in-process history, status and commits
+except ImportError:
+    pygit2 = None
+
+# Environment for every git command the module runs: take no optional locks
+# for read-only commands such as status, and fail instead of waiting on a
+# credential prompt
+_GIT_ENV = {
+    'GIT_OPTIONAL_LOCKS': '0',
+    'GIT_TERMINAL_PROMPT': '0'
+}
+
+# A sync within this many seconds of the last one reuses its result unless forced
+_SYNC_DEBOUNCE_SECONDS = 30
+
+# Status flags that mark a path as changed in the work tree or staged in the index
+if pygit2 is not None:
+    _WT_CHANGED = (pygit2.GIT_STATUS_WT_MODIFIED | pygit2.GIT_STATUS_WT_DELETED |
+                   pygit2.GIT_STATUS_WT_TYPECHANGE | pygit2.GIT_STATUS_WT_RENAMED)
+    _INDEX_CHANGED = (pygit2.GIT_STATUS_INDEX_NEW | pygit2.GIT_STATUS_INDEX_MODIFIED |
+                      pygit2.GIT_STATUS_INDEX_DELETED | pygit2.GIT_STATUS_INDEX_TYPECHANGE |
+                      pygit2.GIT_STATUS_INDEX_RENAMED)
+
+def _iter_file_sizes(path: str):
+    """Yield the size of every file under path, reusing the stat data scandir already has."""
+    try:
+        entries = os.scandir(path)
+    except OSError:
+        return
+    
+    with entries:
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _iter_file_sizes(entry.path)
+                else:
+                    yield entry.stat(follow_symlinks=False).st_size
+            except OSError:
+                pass
+
+# git log record: hash, author, committer date and message, followed by numstat lines
+_LOG_FORMAT = '%x1e%H%x1f%an%x1f%cI%x1f%B%x1f'
+
+# First git release with git log --diff-merges
+_DIFF_MERGES_GIT_VERSION = (2, 31)
+
+def _iso_now() -> str:
+    """Get the current UTC time as an ISO 8601 string with second precision."""
+    return datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+def _parse_commit_object(commit_hash: str, data: bytes) -> Dict[str, Any]:
+    """Pull the history fields out of a raw commit object read with git cat-file."""
+    headers, _, message = data.partition(b'\n\n')
+    
+    author = committer = b''
+    encoding = 'utf-8'
+    for line in headers.split(b'\n'):
+        if line.startswith(b'author '):
+            author = line[7:]
+        elif line.startswith(b'committer '):
+            committer = line[10:]
+        elif line.startswith(b'encoding '):
+            encoding = line[9:].decode('ascii', 'replace')
+    
+    # Identity lines look like: Name <email> 1700000000 +0100
+    timestamp, tz = committer.rpartition(b'> ')[2].split()
+    offset = int(tz[1:3]) * 60 + int(tz[3:5])
+    if tz.startswith(b'-'):
+        offset = -offset
+    date = datetime.fromtimestamp(int(timestamp), timezone(timedelta(minutes=offset)))
+    
+    return {
+        'hash': commit_hash,
+        'message': message.decode(encoding, 'replace').strip(),
+        'author': author.partition(b' <')[0].decode(encoding, 'replace'),
+        'date': date.isoformat()
+    }
+
+def _commit_datetime(commit) -> datetime:
+    """Get the committer date of a pygit2 commit, in the committer's timezone."""
+    offset = timezone(timedelta(minutes=commit.commit_time_offset))
+    return datetime.fromtimestamp(commit.commit_time, offset)
 
 class VersionControlModule:
     """
@@ -22,6 +111,9 @@ class VersionControlModule:
         self.repo_url = repo_url or "https://github.com/kevinpranata97/ai-agent.git"
         self.local_path = local_path or os.getcwd()
         self.repo = None
+        self._libgit = None  # pygit2.Repository for the same repo, when pygit2 is installed
+        self._git_cache = {}  # name -> (stat key of the .git files it was read from, value)
+        self._last_sync = None  # (monotonic time, sync key, sync info) of the last sync
         
         # Initialize or connect to repository
         self._initialize_repository()
@@ -30,30 +122,47 @@ class VersionControlModule:
     
     def _initialize_repository(self):
         """Initialize or connect to the Git repository."""
+        # GitPython is imported here rather than at module import, since loading it
+        # (gitdb, smmap and the git version probe) is only worth paying for when
+        # version control is actually used
+        from git import Repo, InvalidGitRepositoryError
+        
         try:
             # Try to open existing repository
             self.repo = Repo(self.local_path)
-            self.logger.info(f"Connected to existing repository at {self.local_path}")
+            self.logger.info("Connected to existing repository at %s", self.local_path)
         except InvalidGitRepositoryError:
             try:
                 # Clone repository if it doesn't exist locally
-                self.repo = Repo.clone_from(self.repo_url, self.local_path)
-                self.logger.info(f"Cloned repository from {self.repo_url}")
+                self.repo = Repo.clone_from(self.repo_url, self.local_path, env=_GIT_ENV)
+                self.logger.info("Cloned repository from %s", self.repo_url)
             except Exception as e:
                 # Initialize new repository
                 self.repo = Repo.init(self.local_path)
-                self.logger.info(f"Initialized new repository at {self.local_path}")
+                self.logger.info("Initialized new repository at %s", self.local_path)
         except Exception as e:
-            self.logger.error(f"Failed to initialize repository: {str(e)}")
+            self.logger.error("Failed to initialize repository: %s", e)
             self.repo = None
+        
+        if self.repo is not None:
+            self.repo.git.update_environment(**_GIT_ENV)
+        
+        if self.repo is not None and pygit2 is not None:
+            try:
+                self._libgit = pygit2.Repository(self.repo.working_tree_dir or self.repo.git_dir)
+            except Exception as e:
+                self.logger.warning("pygit2 unavailable for repository, using GitPython: %s", e)
+                self._libgit = None
     
-    def commit_task_changes(self, task_id: str, task: Dict[str, Any]) -> Dict[str, Any]:
+    def commit_task_changes(self, task_id: str, task: Dict[str, Any], isolate: bool = True) -> Dict[str, Any]:
         """
         Commit changes related to a specific task.
         
         Args:
             task_id: Unique task identifier
             task: Task dictionary containing task information
+            isolate: Record the commit on a task branch merged into main; when False
+                and main is checked out, commit straight onto main instead
             
         Returns:
             Dictionary containing commit information
@@ -65,29 +174,41 @@ class VersionControlModule:
             }
         
         try:
+            # One timestamp for the commit message and the returned info
+            now = _iso_now()
+            
             # Create a branch for the task if it doesn't exist
             branch_name = f"task-{task_id[:8]}"
             
+            if not isolate and self._on_main():
+                # Commit straight onto main, skipping the task branch
+                return self._commit_to_refs(task_id, task, None, now)
+            
+            if self._is_fast_forward_commit(branch_name):
+                return self._commit_to_refs(task_id, task, branch_name, now)
+            
+            # The task branch has diverged from main: commit on it and merge it back
             # Check if branch exists
-            if branch_name not in [ref.name for ref in self.repo.refs]:
+            branch = self._head(branch_name)
+            if not branch.is_valid():
                 # Create new branch
-                self.repo.create_head(branch_name)
-                self.logger.info(f"Created branch: {branch_name}")
+                branch = self.repo.create_head(branch_name)
+                self.logger.info("Created branch: %s", branch_name)
             
             # Switch to task branch
-            self.repo.heads[branch_name].checkout()
+            branch.checkout()
             
             # Add all changes
             self.repo.git.add('.')
             
             # Create commit message
-            commit_message = self._create_commit_message(task_id, task)
+            commit_message = self._create_commit_message(task_id, task, now)
             
             # Commit changes
             commit = self.repo.index.commit(commit_message)
             
             # Switch back to main branch
-            self.repo.heads.main.checkout()
+            self._head('main').checkout()
             
             # Merge task branch into main
             self.repo.git.merge(branch_name)
@@ -97,21 +218,228 @@ class VersionControlModule:
                 'commit_hash': commit.hexsha,
                 'commit_message': commit_message,
                 'branch': branch_name,
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': now,
                 'files_changed': len(commit.stats.files)
             }
             
-            self.logger.info(f"Committed task {task_id} changes: {commit.hexsha}")
+            self.logger.info("Committed task %s changes: %s", task_id, commit.hexsha)
             
             return commit_info
             
         except Exception as e:
-            self.logger.error(f"Failed to commit task changes: {str(e)}")
+            self.logger.error("Failed to commit task changes: %s", e)
             return {
                 'status': 'failed',
                 'error': str(e)
             }
     
+    def _git_files_key(self, *names: str) -> tuple:
+        """
+        Build a stat key for files under the git directory.
+        
+        git rewrites refs, HEAD and config through a lock file and rename, so the
+        inode and mtime of each file change whenever its contents do.
+        """
+        key = []
+        for name in names:
+            base = self.repo.git_dir if name == 'HEAD' else self.repo.common_dir
+            try:
+                st = os.stat(os.path.join(base, name))
+                key.append((st.st_ino, st.st_mtime_ns, st.st_size))
+            except OSError:
+                key.append(None)
+        return tuple(key)
+    
+    def _cached_git_value(self, name: str, key: tuple, compute):
+        """Return a cached value while its stat key is unchanged, recomputing it otherwise."""
+        cached = self._git_cache.get(name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        value = compute()
+        self._git_cache[name] = (key, value)
+        return value
+    
+    def _head(self, branch_name: str) -> 'git.Head':
+        """
+        Get a local branch by name.
+        
+        Builds the ref directly instead of indexing repo.heads, which lists and
+        scans every branch.
+        """
+        from git import Head
+        return Head(self.repo, f"refs/heads/{branch_name}")
+    
+    def _active_branch_name(self) -> str:
+        """Get the checked out branch name, re-read only when HEAD changes."""
+        return self._cached_git_value(
+            'active_branch', self._git_files_key('HEAD'),
+            lambda: self.repo.active_branch.name
+        )
+    
+    def _remote_list(self) -> List[Dict[str, str]]:
+        """Get the configured remotes, re-read only when the repository config changes."""
+        remotes = self._cached_git_value(
+            'remotes', self._git_files_key('config'),
+            lambda: tuple((remote.name, str(remote.url)) for remote in self.repo.remotes)
+        )
+        return [{'name': name, 'url': url} for name, url in remotes]
+    
+    def _on_main(self) -> bool:
+        """Check whether main is checked out with at least one commit."""
+        if self._libgit is not None:
+            repo = self._libgit
+            return not repo.head_is_unborn and repo.head.name == 'refs/heads/main'
+        
+        try:
+            return self._active_branch_name() == 'main'
+        except TypeError:
+            # Detached HEAD
+            return False
+    
+    def _is_fast_forward_commit(self, branch_name: str) -> bool:
+        """
+        Check whether a task commit can go straight onto the branch refs.
+        
+        That is the case when main is checked out and the task branch is new or
+        points at main, so the commit lands on both as a fast-forward and no
+        checkout or merge is needed.
+        """
+        if not self._on_main():
+            return False
+        
+        if self._libgit is not None:
+            repo = self._libgit
+            branch = repo.references.get(f"refs/heads/{branch_name}")
+            return branch is None or branch.target == repo.head.target
+        
+        branch = self._head(branch_name)
+        return not branch.is_valid() or branch.commit == self.repo.head.commit
+    
+    def _commit_to_refs(self, task_id: str, task: Dict[str, Any],
+                        branch_name: Optional[str], now: str) -> Dict[str, Any]:
+        """Commit onto main (and the task branch, if given) without checking anything out."""
+        if self._libgit is not None:
+            return self._commit_with_libgit2(task_id, task, branch_name, now)
+        return self._commit_with_plumbing(task_id, task, branch_name, now)
+    
+    def _commit_with_plumbing(self, task_id: str, task: Dict[str, Any],
+                              branch_name: Optional[str], now: str) -> Dict[str, Any]:
+        """
+        Commit task changes to the task branch and fast-forward main with git plumbing.
+        
+        write-tree, commit-tree and update-ref create the commit and move the refs
+        without checking anything out, so the working tree is never rewritten.
+        Without a branch name the commit goes onto main alone.
+        """
+        # Add all changes
+        self.repo.git.add('.')
+        
+        commit_message = self._create_commit_message(task_id, task, now)
+        
+        parent = self.repo.head.commit.hexsha
+        tree = self.repo.git.write_tree()
+        commit_hash = self.repo.git.commit_tree(tree, '-p', parent, '-m', commit_message,
+                                                env=self._identity_env())
+        
+        if branch_name is not None:
+            if not self._head(branch_name).is_valid():
+                self.logger.info("Created branch: %s", branch_name)
+            self.repo.git.update_ref(f"refs/heads/{branch_name}", commit_hash)
+        
+        # Merging the task branch into main is a fast-forward
+        self.repo.git.update_ref('refs/heads/main', commit_hash, parent)
+        
+        commit = self.repo.commit(commit_hash)
+        
+        commit_info = {
+            'status': 'success',
+            'commit_hash': commit_hash,
+            'commit_message': commit_message,
+            'branch': branch_name or 'main',
+            'timestamp': now,
+            'files_changed': len(commit.stats.files)
+        }
+        
+        self.logger.info("Committed task %s changes: %s", task_id, commit_hash)
+        
+        return commit_info
+    
+    def _commit_with_libgit2(self, task_id: str, task: Dict[str, Any],
+                             branch_name: Optional[str], now: str) -> Dict[str, Any]:
+        """
+        Commit task changes to the task branch and fast-forward main, in-process.
+        
+        The commit is written straight to the branch ref, so no checkouts happen.
+        Without a branch name the commit goes onto main alone.
+        """
+        repo = self._libgit
+        if branch_name is not None and f"refs/heads/{branch_name}" not in repo.references:
+            repo.branches.local.create(branch_name, repo.head.peel(pygit2.Commit))
+            self.logger.info("Created branch: %s", branch_name)
+        
+        # Add all changes
+        index = repo.index
+        index.add_all()
+        index.write()
+        tree = index.write_tree()
+        
+        commit_message = self._create_commit_message(task_id, task, now)
+        author, committer = self._signatures()
+        commit_ref = f"refs/heads/{branch_name}" if branch_name is not None else 'refs/heads/main'
+        commit_id = repo.create_commit(commit_ref, author, committer,
+                                       commit_message, tree, [repo.head.target])
+        
+        if branch_name is not None:
+            # Merging the task branch into main is a fast-forward
+            repo.references['refs/heads/main'].set_target(commit_id)
+        
+        commit = repo[commit_id]
+        if commit.parents:
+            files_changed = repo.diff(commit.parents[0], commit).stats.files_changed
+        else:
+            files_changed = commit.tree.diff_to_tree(swap=True).stats.files_changed
+        
+        commit_info = {
+            'status': 'success',
+            'commit_hash': str(commit_id),
+            'commit_message': commit_message,
+            'branch': branch_name or 'main',
+            'timestamp': now,
+            'files_changed': files_changed
+        }
+        
+        self.logger.info("Committed task %s changes: %s", task_id, commit_id)
+        
+        return commit_info
+    
+    def _identity_env(self) -> Dict[str, str]:
+        """
+        Build the author and committer environment for git commit-tree.
+        
+        commit-tree refuses to run without a configured identity, while
+        repo.index.commit falls back to GitPython's default one; passing that
+        identity explicitly lets both paths commit in the same environments.
+        """
+        from git import Actor
+        reader = self.repo.config_reader()
+        author = Actor.author(reader)
+        committer = Actor.committer(reader)
+        return {
+            'GIT_AUTHOR_NAME': author.name,
+            'GIT_AUTHOR_EMAIL': author.email,
+            'GIT_COMMITTER_NAME': committer.name,
+            'GIT_COMMITTER_EMAIL': committer.email
+        }
+    
+    def _signatures(self) -> tuple:
+        """Build pygit2 (author, committer) signatures from the identities GitPython would commit with."""
+        from git import Actor
+        reader = self.repo.config_reader()
+        author = Actor.author(reader)
+        committer = Actor.committer(reader)
+        return (pygit2.Signature(author.name, author.email),
+                pygit2.Signature(committer.name, committer.email))
+    
     def push_changes(self, branch: str = 'main') -> Dict[str, Any]:
         """
         Push changes to remote repository.
@@ -138,16 +466,16 @@ class VersionControlModule:
             result = {
                 'status': 'success',
                 'branch': branch,
-                'pushed_at': datetime.now().isoformat(),
+                'pushed_at': _iso_now(),
                 'remote_url': str(origin.url)
             }
             
-            self.logger.info(f"Pushed changes to {branch}")
+            self.logger.info("Pushed changes to %s", branch)
             
             return result
             
         except Exception as e:
-            self.logger.error(f"Failed to push changes: {str(e)}")
+            self.logger.error("Failed to push changes: %s", e)
             return {
                 'status': 'failed',
                 'error': str(e)
@@ -168,17 +496,18 @@ class VersionControlModule:
         # For now, return a placeholder response
         
         branch_name = f"task-{task_id[:8]}"
+        now = _iso_now()
         
         pr_info = {
             'status': 'created',
             'branch': branch_name,
             'title': f"Task {task_id[:8]}: {task['description'][:50]}...",
-            'description': self._create_pr_description(task_id, task),
-            'created_at': datetime.now().isoformat(),
+            'description': self._create_pr_description(task_id, task, now),
+            'created_at': now,
             'url': f"https://github.com/kevinpranata97/ai-agent/pull/placeholder"
         }
         
-        self.logger.info(f"Pull request created for task {task_id}")
+        self.logger.info("Pull request created for task %s", task_id)
         
         return pr_info
     
@@ -198,20 +527,59 @@ class VersionControlModule:
         try:
             commits = []
             
-            for commit in self.repo.iter_commits(max_count=limit):
+            if self._libgit is not None:
+                repo = self._libgit
+                walker = repo.walk(repo.head.target, pygit2.GIT_SORT_TOPOLOGICAL | pygit2.GIT_SORT_TIME)
+                for commit in itertools.islice(walker, limit):
+                    if commit.parents:
+                        diff = repo.diff(commit.parents[0], commit)
+                    else:
+                        diff = commit.tree.diff_to_tree(swap=True)
+                    commits.append({
+                        'hash': str(commit.id),
+                        'message': commit.message.strip(),
+                        'author': commit.author.name,
+                        'date': _commit_datetime(commit).isoformat(),
+                        'files_changed': diff.stats.files_changed
+                    })
+                return commits
+            
+            if self.repo.git.version_info < _DIFF_MERGES_GIT_VERSION:
+                # Older git cannot diff merges against their first parent in git
+                # log, so read each commit's stats separately
+                for commit in self.repo.iter_commits(max_count=limit):
+                    commits.append({
+                        'hash': commit.hexsha,
+                        'message': commit.message.strip(),
+                        'author': commit.author.name,
+                        'date': commit.committed_datetime.isoformat(),
+                        'files_changed': len(commit.stats.files)
+                    })
+                return commits
+            
+            # One git log run lists every commit with its per-file numstat lines,
+            # instead of a diff per commit for commit.stats
+            output = self.repo.git.log(
+                f"--max-count={limit}", f"--format={_LOG_FORMAT}",
+                '--numstat', '--no-renames', '--diff-merges=first-parent'
+            )
+            
+            for record in output.split('\x1e')[1:]:
+                commit_hash, author, date, message, numstat = record.split('\x1f')
+                files = {line.split('\t', 2)[2] for line in numstat.splitlines() if line}
                 commit_info = {
-                    'hash': commit.hexsha,
-                    'message': commit.message.strip(),
-                    'author': str(commit.author),
-                    'date': commit.committed_datetime.isoformat(),
-                    'files_changed': len(commit.stats.files)
+                    'hash': commit_hash,
+                    'message': message.strip(),
+                    'author': author,
+                    'date': date,
+                    'files_changed': len(files)
                 }
                 commits.append(commit_info)
             
             return commits
             
         except Exception as e:
-            self.logger.error(f"Failed to get commit history: {str(e)}")
+            self.logger.error("Failed to get commit history: %s", e)
             return []
     
     def get_repository_status(self) -> Dict[str, Any]:
@@ -228,27 +596,24 @@ class VersionControlModule:
             }
         
         try:
-            # Get current branch
-            current_branch = self.repo.active_branch.name
-            
-            # Get untracked files
-            untracked_files = self.repo.untracked_files
+            if self._libgit is not None:
+                return self._libgit2_status()
             
-            # Get modified files
-            modified_files = [item.a_path for item in self.repo.index.diff(None)]
+            # Get current branch
+            current_branch = self._active_branch_name()
             
-            # Get staged files
-            staged_files = [item.a_path for item in self.repo.index.diff("HEAD")]
+            # Get untracked, modified and staged files from a single status run
+            untracked_files, modified_files, staged_files = self._porcelain_status()
             
             # Get remote info
-            remotes = [{'name': remote.name, 'url': str(remote.url)} for remote in self.repo.remotes]
+            remotes = self._remote_list()
             
             status = {
                 'status': 'initialized',
                 'current_branch': current_branch,
-                'untracked_files': len(untracked_files),
-                'modified_files': len(modified_files),
-                'staged_files': len(staged_files),
+                'untracked_files': untracked_files,
+                'modified_files': modified_files,
+                'staged_files': staged_files,
                 'remotes': remotes,
                 'last_commit': {
                     'hash': self.repo.head.commit.hexsha,
@@ -260,12 +625,68 @@ class VersionControlModule:
             return status
             
         except Exception as e:
-            self.logger.error(f"Failed to get repository status: {str(e)}")
+            self.logger.error("Failed to get repository status: %s", e)
             return {
                 'status': 'error',
                 'error': str(e)
             }
     
+    def _porcelain_status(self) -> tuple:
+        """
+        Count changed paths with one git status --porcelain=v2 run.
+        
+        Returns:
+            Tuple of (untracked, modified in the work tree, staged in the index) counts
+        """
+        output = self.repo.git.status('--porcelain=v2', '-z', '--untracked-files=all')
+        
+        untracked_files = modified_files = staged_files = 0
+        records = iter(output.split('\0'))
+        for record in records:
+            kind = record[:1]
+            if kind == '?':
+                untracked_files += 1
+            elif kind in ('1', '2'):
+                # "<kind> XY ...": X is the index state, Y the work tree state
+                if record[2] != '.':
+                    staged_files += 1
+                if record[3] != '.':
+                    modified_files += 1
+                if kind == '2':
+                    # Renames and copies carry the original path as an extra record
+                    next(records, None)
+        
+        return untracked_files, modified_files, staged_files
+    
+    def _libgit2_status(self) -> Dict[str, Any]:
+        """Build the repository status from a single libgit2 status scan."""
+        repo = self._libgit
+        
+        untracked_files = modified_files = staged_files = 0
+        for flags in repo.status().values():
+            if flags & pygit2.GIT_STATUS_WT_NEW:
+                untracked_files += 1
+            if flags & _WT_CHANGED:
+                modified_files += 1
+            if flags & _INDEX_CHANGED:
+                staged_files += 1
+        
+        head_commit = repo.head.peel(pygit2.Commit)
+        
+        return {
+            'status': 'initialized',
+            'current_branch': repo.head.shorthand,
+            'untracked_files': untracked_files,
+            'modified_files': modified_files,
+            'staged_files': staged_files,
+            'remotes': [{'name': remote.name, 'url': remote.url} for remote in repo.remotes],
+            'last_commit': {
+                'hash': str(head_commit.id),
+                'message': head_commit.message.strip(),
+                'date': _commit_datetime(head_commit).isoformat()
+            }
+        }
+    
     def create_tag(self, tag_name: str, message: str = None) -> Dict[str, Any]:
         """
         Create a Git tag.
@@ -292,26 +713,27 @@ class VersionControlModule:
                 'tag_name': tag_name,
                 'message': message,
                 'commit_hash': tag.commit.hexsha,
-                'created_at': datetime.now().isoformat()
+                'created_at': _iso_now()
             }
             
-            self.logger.info(f"Created tag: {tag_name}")
+            self.logger.info("Created tag: %s", tag_name)
             
             return tag_info
             
         except Exception as e:
-            self.logger.error(f"Failed to create tag: {str(e)}")
+            self.logger.error("Failed to create tag: %s", e)
             return {
                 'status': 'failed',
                 'error': str(e)
             }
     
-    def backup_repository(self, backup_path: str) -> Dict[str, Any]:
+    def backup_repository(self, backup_path: str, bare: bool = True) -> Dict[str, Any]:
         """
         Create a backup of the repository.
         
         Args:
             backup_path: Path where to create the backup
+            bare: Back up only the git data, skipping the working tree checkout
             
         Returns:
             Dictionary containing backup information
@@ -326,31 +748,51 @@ class VersionControlModule:
             # Create backup directory
             os.makedirs(backup_path, exist_ok=True)
             
-            # Clone repository to backup location
-            backup_repo = Repo.clone_from(self.local_path, backup_path)
+            # Clone repository to backup location; --local copies the object files
+            # directly instead of repacking them through the transport, and
+            # --no-hardlinks keeps the copies independent of the source's inodes
+            clone_args = ['--local', '--no-hardlinks']
+            if bare:
+                clone_args.append('--bare')
+            self.repo.git.clone(*clone_args, os.path.abspath(self.local_path),
+                                os.path.abspath(backup_path))
             
             backup_info = {
                 'status': 'success',
                 'backup_path': backup_path,
-                'created_at': datetime.now().isoformat(),
+                'bare': bare,
+                'created_at': _iso_now(),
                 'size': self._get_directory_size(backup_path)
             }
             
-            self.logger.info(f"Repository backed up to: {backup_path}")
+            self.logger.info("Repository backed up to: %s", backup_path)
             
             return backup_info
             
         except Exception as e:
-            self.logger.error(f"Failed to backup repository: {str(e)}")
+            self.logger.error("Failed to backup repository: %s", e)
             return {
                 'status': 'failed',
                 'error': str(e)
             }
     
-    def sync_with_remote(self) -> Dict[str, Any]:
+    def sync_with_remote(self, timeout: float = 60, force: bool = False) -> Dict[str, Any]:
         """
         Sync local repository with remote.
         
+        All remotes are fetched concurrently, then the current branch is merged
+        with its upstream. A remote that fails or hangs past the timeout does not
+        hold up the others; only a failed origin fetch fails the sync.
+        
+        Back-to-back syncs are debounced: within _SYNC_DEBOUNCE_SECONDS of a
+        successful sync, and while nothing else has fetched, switched branch or
+        moved HEAD since, the previous result is returned without contacting the
+        remotes; nothing is pulled by a debounced sync, so it reports no changes.
+        
+        Args:
+            timeout: Seconds each remote fetch may take before it is abandoned
+            force: Always contact the remotes, even within the debounce window
+            
         Returns:
             Dictionary containing sync information
         """
@@ -360,88 +802,177 @@ class VersionControlModule:
                 'error': 'Repository not initialized'
             }
         
+        if not force and self._last_sync is not None:
+            synced, sync_key, last_info = self._last_sync
+            if (time.monotonic() - synced < _SYNC_DEBOUNCE_SECONDS
+                    and sync_key == self._sync_key()):
+                self.logger.debug("Skipping sync, last sync was %.1fs ago", time.monotonic() - synced)
+                return {**last_info, 'pulled_changes': 0, 'cached': True}
+        
         try:
-            # Fetch from remote
+            # Fetch from every remote at once
             origin = self.repo.remote('origin')
-            fetch_info = origin.fetch()
+            remote_names = [remote.name for remote in self.repo.remotes]
+            fetch_results = asyncio.run(self._fetch_remotes(remote_names, timeout))
             
-            # Pull changes
-            pull_info = origin.pull()
+            failed_remotes = {}
+            fetched_refs = 0
+            for name, result in fetch_results.items():
+                if isinstance(result, BaseException):
+                    if name == origin.name:
+                        raise result
+                    failed_remotes[name] = str(result) or type(result).__name__
+                    self.logger.warning("Failed to fetch remote %s: %s", name, failed_remotes[name])
+                else:
+                    # fetch -v reports one "old -> new" line per ref it looked at
+                    fetched_refs += sum(1 for line in result.splitlines() if ' -> ' in line)
+            
+            # Merge the fetched upstream into the current branch
+            previous_head = self.repo.head.commit.hexsha
+            self.repo.git.merge('@{upstream}')
+            pulled_changes = int(self.repo.git.rev_list('--count', f"{previous_head}..HEAD"))
             
             sync_info = {
                 'status': 'success',
-                'fetched_refs': len(fetch_info),
-                'pulled_changes': len(pull_info),
-                'synced_at': datetime.now().isoformat()
+                'fetched_refs': fetched_refs,
+                'pulled_changes': pulled_changes,
+                'failed_remotes': failed_remotes,
+                'synced_at': _iso_now()
             }
             
+            self._last_sync = (time.monotonic(), self._sync_key(), sync_info)
+            
             self.logger.info("Repository synced with remote")
             
             return sync_info
             
         except Exception as e:
-            self.logger.error(f"Failed to sync with remote: {str(e)}")
+            self.logger.error("Failed to sync with remote: %s", e)
             return {
                 'status': 'failed',
                 'error': str(e)
             }
     
-    def _create_commit_message(self, task_id: str, task: Dict[str, Any]) -> str:
-        """Create a descriptive commit message for a task."""
+    def _sync_key(self) -> tuple:
+        """
+        Build the key a debounced sync result is valid for.
+        
+        Combines the FETCH_HEAD stat key with the checked out branch and commit,
+        so a fetch, checkout, commit or reset since the last sync invalidates it.
+        """
+        head = self.repo.head
+        try:
+            branch = None if head.is_detached else head.reference.path
+            commit = head.commit.hexsha
+        except ValueError:
+            # No commits yet
+            branch = commit = None
+        return (self._git_files_key('FETCH_HEAD'), branch, commit)
+    
+    async def _git(self, *args: str, timeout: float = 30) -> str:
+        """
+        Run a git command in the repository without blocking the event loop.
+        
+        Args:
+            *args: git arguments
+            timeout: Seconds to wait before the command is killed
+            
+        Returns:
+            The command's stderr output, where git reports fetch progress
+        """
+        process = await asyncio.create_subprocess_exec(
+            'git', *args,
+            cwd=self.repo.working_tree_dir or self.repo.git_dir,
+            env={**os.environ, **self.repo.git.environment()},
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        try:
+            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            raise
+        
+        if process.returncode != 0:
+            from git import GitCommandError
+            raise GitCommandError(['git', *args], process.returncode, stderr, stdout)
+        
+        return stderr.decode(errors='replace')
+    
+    async def _fetch_remotes(self, remote_names: List[str], timeout: float) -> Dict[str, Any]:
+        """Fetch remotes concurrently, mapping each name to its fetch output or exception."""
+        results = await asyncio.gather(
+            *(self._git('fetch', '-v', name, timeout=timeout) for name in remote_names),
+            return_exceptions=True
+        )
+        return dict(zip(remote_names, results))
+    
+    def _create_commit_message(self, task_id: str, task: Dict[str, Any], now: Optional[str] = None) -> str:
+        """Create a descriptive commit message for a task, stamped with now (default: current time)."""
         task_type = task.get('type', 'general')
-        description = task['description'][:50]
+        full_description = task['description']
         
-        commit_message = f"[{task_type.upper()}] {description}...\n\n"
-        commit_message += f"Task ID: {task_id}\n"
-        commit_message += f"Description: {task['description']}\n"
-        commit_message += f"Created: {task.get('created_at', 'Unknown')}\n"
-        commit_message += f"Status: {task.get('status', 'Unknown')}\n"
+        lines = [
+            f"[{task_type.upper()}] {full_description[:50]}...",
+            "",
+            f"Task ID: {task_id}",
+            f"Description: {full_description}",
+            f"Created: {task.get('created_at', 'Unknown')}",
+            f"Status: {task.get('status', 'Unknown')}"
+        ]
         
-        if 'plan' in task:
-            plan = task['plan']
-            commit_message += f"Steps: {plan.get('execution_plan', {}).get('total_steps', 'Unknown')}\n"
+        plan = task.get('plan')
+        if plan is not None:
+            lines.append(f"Steps: {plan.get('execution_plan', {}).get('total_steps', 'Unknown')}")
         
-        commit_message += f"\nCommitted by AI Agent at {datetime.now().isoformat()}"
+        lines.append("")
+        lines.append(f"Committed by AI Agent at {now or _iso_now()}")
         
-        return commit_message
+        return "\n".join(lines)
     
-    def _create_pr_description(self, task_id: str, task: Dict[str, Any]) -> str:
-        """Create a pull request description for a task."""
-        description = f"## Task: {task['description']}\n\n"
-        description += f"**Task ID:** {task_id}\n"
-        description += f"**Type:** {task.get('type', 'general')}\n"
-        description += f"**Priority:** {task.get('priority', 'medium')}\n"
-        description += f"**Created:** {task.get('created_at', 'Unknown')}\n\n"
+    def _create_pr_description(self, task_id: str, task: Dict[str, Any], now: Optional[str] = None) -> str:
+        """Create a pull request description for a task, stamped with now (default: current time)."""
+        lines = [
+            f"## Task: {task['description']}",
+            "",
+            f"**Task ID:** {task_id}",
+            f"**Type:** {task.get('type', 'general')}",
+            f"**Priority:** {task.get('priority', 'medium')}",
+            f"**Created:** {task.get('created_at', 'Unknown')}",
+            ""
+        ]
         
-        if 'plan' in task:
-            plan = task['plan']
-            description += "## Execution Plan\n\n"
+        plan = task.get('plan')
+        if plan is not None:
+            lines.append("## Execution Plan")
+            lines.append("")
             
             if 'execution_plan' in plan:
                 steps = plan['execution_plan'].get('steps', [])
-                for step in steps:
-                    description += f"- **{step.get('title', 'Unknown')}**: {step.get('description', 'No description')}\n"
+                lines.extend(
+                    f"- **{step.get('title', 'Unknown')}**: {step.get('description', 'No description')}"
+                    for step in steps
+                )
             
-            description += f"\n**Estimated Time:** {plan.get('resource_estimate', {}).get('estimated_time_minutes', 'Unknown')} minutes\n"
-        
-        description += "\n## Changes\n\n"
-        description += "This pull request contains all changes made by the AI Agent for this task.\n"
+            lines.append("")
+            lines.append(f"**Estimated Time:** {plan.get('resource_estimate', {}).get('estimated_time_minutes', 'Unknown')} minutes")
         
-        description += f"\n---\n*Generated by AI Agent on {datetime.now().isoformat()}*"
+        lines.extend([
+            "",
+            "## Changes",
+            "",
+            "This pull request contains all changes made by the AI Agent for this task.",
+            "",
+            "---",
+            f"*Generated by AI Agent on {now or _iso_now()}*"
+        ])
         
-        return description
+        return "\n".join(lines)
     
     def _get_directory_size(self, path: str) -> str:
         """Get the size of a directory in human-readable format."""
-        total_size = 0
-        
-        for dirpath, dirnames, filenames in os.walk(path):
-            for filename in filenames:
-                filepath = os.path.join(dirpath, filename)
-                try:
-                    total_size += os.path.getsize(filepath)
-                except OSError:
-                    pass
+        total_size = sum(_iter_file_sizes(path))
         
         # Convert to human-readable format
         for unit in ['B', 'KB', 'MB', 'GB']:
@@ -468,18 +999,69 @@ class VersionControlModule:
         try:
             commits = []
             
-            for commit in self.repo.iter_commits(paths=file_path, max_count=limit):
-                commit_info = {
-                    'hash': commit.hexsha,
-                    'message': commit.message.strip(),
-                    'author': str(commit.author),
-                    'date': commit.committed_datetime.isoformat()
-                }
-                commits.append(commit_info)
+            if self._libgit is not None:
+                for commit in itertools.islice(self._libgit2_file_commits(file_path), limit):
+                    commits.append({
+                        'hash': str(commit.id),
+                        'message': commit.message.strip(),
+                        'author': commit.author.name,
+                        'date': _commit_datetime(commit).isoformat()
+                    })
+                return commits
+            
+            # List the matching commits in one rev-list run, then read each object
+            # through GitPython's long-lived cat-file --batch process
+            commit_hashes = self.repo.git.rev_list(f"--max-count={limit}", 'HEAD', '--', file_path).split()
+            
+            for commit_hash in commit_hashes:
+                _, _, _, data = self.repo.git.get_object_data(commit_hash)
+                commits.append(_parse_commit_object(commit_hash, data))
             
             return commits
             
         except Exception as e:
-            self.logger.error(f"Failed to get file history: {str(e)}")
+            self.logger.error("Failed to get file history: %s", e)
             return []
-
+    
+    def _libgit2_file_commits(self, file_path: str):
+        """
+        Yield the commits that changed a path, newest first.
+        
+        Follows git log's default history simplification: a commit whose entry
+        for the path matches one of its parents is skipped and only that parent
+        is followed, so a merge that took one side's version leaves out the
+        other side's history. Other commits are yielded and all their parents
+        followed. Commits are visited by committer date, as git log orders them.
+        """
+        repo = self._libgit
+        if os.path.isabs(file_path):
+            file_path = os.path.relpath(file_path, repo.workdir)
+        path = file_path.replace(os.sep, '/').strip('/')
+        
+        def entry_id(commit):
+            try:
+                return commit.tree[path].id
+            except KeyError:
+                return None
+        
+        # Max-heap on committer date; the sequence number keeps equal dates FIFO
+        sequence = itertools.count()
+        head = repo.head.peel(pygit2.Commit)
+        queue = [(-head.commit_time, next(sequence), head)]
+        seen = {head.id}
+        
+        while queue:
+            _, _, commit = heapq.heappop(queue)
+            current = entry_id(commit)
+            parents = commit.parents
+            
+            same_parent = next((parent for parent in parents if entry_id(parent) == current), None)
+            if same_parent is not None:
+                parents = [same_parent]
+            elif parents or current is not None:
+                yield commit
+            
+            for parent in parents:
+                if parent.id not in seen:
+                    seen.add(parent.id)
+                    heapq.heappush(queue, (-parent.commit_time, next(sequence), parent))
@@ -4,10 +4,16 @@ Centralized logging configuration for the AI Agent.
 """
 
 import os
+import re
+import queue
+import atexit
 import logging
-import logging.handlers
+import threading
 from datetime import datetime
 
+# Matches records that belong in the task log
+_TASK_RE = re.compile(r'task', re.IGNORECASE)
+
 def setup_logging(name=None, log_level=logging.INFO, log_dir="logs"):
     """
     Setup centralized logging for the AI Agent.
@@ -20,6 +26,8 @@ def setup_logging(name=None, log_level=logging.INFO, log_dir="logs"):
     Returns:
         Logger instance
     """
+    import logging.handlers
+    
     # Create logs directory if it doesn't exist
     if not os.path.exists(log_dir):
         os.makedirs(log_dir)
@@ -56,7 +64,6 @@ def setup_logging(name=None, log_level=logging.INFO, log_dir="logs"):
     )
     file_handler.setLevel(log_level)
     file_handler.setFormatter(detailed_formatter)
-    logger.addHandler(file_handler)
     
     # Error file handler
     error_log_file = os.path.join(log_dir, f"ai_agent_errors_{datetime.now().strftime('%Y%m%d')}.log")
@@ -65,7 +72,6 @@ def setup_logging(name=None, log_level=logging.INFO, log_dir="logs"):
     )
     error_handler.setLevel(logging.ERROR)
     error_handler.setFormatter(detailed_formatter)
-    logger.addHandler(error_handler)
     
     # Task-specific handler
     task_log_file = os.path.join(log_dir, f"ai_agent_tasks_{datetime.now().strftime('%Y%m%d')}.log")
@@ -78,57 +84,80 @@ def setup_logging(name=None, log_level=logging.INFO, log_dir="logs"):
     # Create a filter for task-related logs
     class TaskFilter(logging.Filter):
         def filter(self, record):
-            return 'task' in record.getMessage().lower() or 'Task' in record.getMessage()
+            # Check the raw format string first; only records whose arguments
+            # might supply the word pay for formatting the message
+            msg = record.msg
+            if isinstance(msg, str):
+                if _TASK_RE.search(msg):
+                    return True
+                if not record.args:
+                    return False
+            return _TASK_RE.search(record.getMessage()) is not None
     
     task_handler.addFilter(TaskFilter())
-    logger.addHandler(task_handler)
+    
+    # The file handlers run on a listener thread, so logging calls only enqueue
+    # the record instead of waiting on disk writes
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(
+        log_queue, file_handler, error_handler, task_handler, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)  # Flush queued records on interpreter exit
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
     
     logger.info(f"Logging system initialized for {logger_name}")
     
     return logger
 
+class _TaskLogDirFilter(logging.Filter):
+    """Pass only the task records meant for one log directory."""
+    
+    def __init__(self, log_dir):
+        super().__init__()
+        self.log_dir = log_dir
+    
+    def filter(self, record):
+        return getattr(record, 'task_log_dir', None) == self.log_dir
+
+# Shared append-mode handler per log directory, so tasks never open their own files
+_task_handlers = {}
+# Makes the first lookup and insert per log directory atomic, so concurrent
+# callers never attach two handlers for the same file
+_task_handlers_lock = threading.Lock()
+
 def get_task_logger(task_id: str, log_dir="logs"):
     """
     Get a logger specific to a task.
     
+    All tasks write to one shared ai_agent_tasks.log per log directory, with
+    every line tagged by its task ID.
+    
     Args:
         task_id: Unique task identifier
         log_dir: Directory to store log files
         
     Returns:
-        Logger instance for the specific task
+        Logger adapter that tags records with the task ID
     """
-    # Create task-specific logs directory
-    task_log_dir = os.path.join(log_dir, "tasks", task_id)
-    if not os.path.exists(task_log_dir):
-        os.makedirs(task_log_dir)
-    
-    # Create task-specific logger
-    logger_name = f'ai_agent.task.{task_id}'
-    logger = logging.getLogger(logger_name)
+    logger = logging.getLogger('ai_agent.task')
     logger.setLevel(logging.INFO)
     
-    # Clear any existing handlers
-    logger.handlers.clear()
-    
-    # Create formatter
-    formatter = logging.Formatter(
-        '%(asctime)s - %(levelname)s - %(message)s'
-    )
-    
-    # Task-specific file handler
-    task_log_file = os.path.join(task_log_dir, f"task_{task_id}.log")
-    task_handler = logging.FileHandler(task_log_file)
-    task_handler.setLevel(logging.INFO)
-    task_handler.setFormatter(formatter)
-    logger.addHandler(task_handler)
-    
-    # Also add to main logger
-    main_logger = logging.getLogger('ai_agent')
-    if main_logger.handlers:
-        logger.addHandler(main_logger.handlers[0])  # Console handler
-    
-    return logger
+    with _task_handlers_lock:
+        if log_dir not in _task_handlers:
+            if not os.path.exists(log_dir):
+                os.makedirs(log_dir)
+            
+            task_handler = logging.FileHandler(os.path.join(log_dir, "ai_agent_tasks.log"))
+            task_handler.setLevel(logging.INFO)
+            task_handler.setFormatter(logging.Formatter(
+                '%(asctime)s - [%(task_id)s] - %(levelname)s - %(message)s'
+            ))
+            task_handler.addFilter(_TaskLogDirFilter(log_dir))
+            logger.addHandler(task_handler)
+            _task_handlers[log_dir] = task_handler
+    
+    return logging.LoggerAdapter(logger, {'task_id': task_id, 'task_log_dir': log_dir})
 
 class TaskLogContext:
     """
@@ -142,19 +171,14 @@ class TaskLogContext:
     
     def __enter__(self):
         self.logger = get_task_logger(self.task_id, self.log_dir)
-        self.logger.info(f"Starting task {self.task_id}")
+        self.logger.info("Starting task %s", self.task_id)
         return self.logger
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         if exc_type:
-            self.logger.error(f"Task {self.task_id} failed: {exc_val}")
+            self.logger.error("Task %s failed: %s", self.task_id, exc_val)
         else:
-            self.logger.info(f"Task {self.task_id} completed successfully")
-        
-        # Clean up handlers
-        for handler in self.logger.handlers[:]:
-            handler.close()
-            self.logger.removeHandler(handler)
+            self.logger.info("Task %s completed successfully", self.task_id)
 
 def log_function_call(func):
     """
@@ -194,18 +218,16 @@ def log_performance(func):
     
     def wrapper(*args, **kwargs):
         logger = logging.getLogger('ai_agent')
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         
         try:
             result = func(*args, **kwargs)
-            end_time = time.time()
-            execution_time = end_time - start_time
-            logger.info(f"{func.__name__} executed in {execution_time:.2f} seconds")
+            execution_time = (time.perf_counter_ns() - start_time) / 1e9
+            logger.info("%s executed in %.2f seconds", func.__name__, execution_time)
             return result
         except Exception as e:
-            end_time = time.time()
-            execution_time = end_time - start_time
-            logger.error(f"{func.__name__} failed after {execution_time:.2f} seconds: {str(e)}")
+            execution_time = (time.perf_counter_ns() - start_time) / 1e9
+            logger.error("%s failed after %.2f seconds: %s", func.__name__, execution_time, e)
             raise
     
     return wrapper
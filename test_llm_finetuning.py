@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+LLMFineTuningModule Test Suite
+Tests the running usage counters against a stubbed OpenAI client.
+"""
+
+import sys
+import itertools
+from types import SimpleNamespace
+
+import pytest
+
+from modules.llm_finetuning import LLMFineTuningModule
+
+class _FakeJobs:
+    """Stand-in for client.fine_tuning.jobs whose job states are set by the test."""
+
+    def __init__(self):
+        self.states = {}  # job id -> (status, trained_tokens)
+        self._ids = itertools.count(1)
+
+    def _job(self, job_id):
+        status, trained_tokens = self.states[job_id]
+        return SimpleNamespace(
+            id=job_id, status=status, model='gpt-3.5-turbo', created_at=0,
+            finished_at=None, fine_tuned_model=None, training_file='file-1',
+            validation_file=None, result_files=[], trained_tokens=trained_tokens
+        )
+
+    def create(self, **params):
+        job_id = f"ftjob-{next(self._ids)}"
+        self.states[job_id] = ('pending', None)
+        return self._job(job_id)
+
+    def retrieve(self, job_id):
+        return self._job(job_id)
+
+    def cancel(self, job_id):
+        self.states[job_id] = ('cancelled', None)
+        return self._job(job_id)
+
+@pytest.fixture
+def finetuning():
+    """A fine-tuning module whose OpenAI client is replaced by _FakeJobs."""
+    module = LLMFineTuningModule(api_key='test-key-for-stats')
+    module.client = SimpleNamespace(fine_tuning=SimpleNamespace(jobs=_FakeJobs()))
+    return module
+
+def _recount(module):
+    """Count the usage statistics from scratch over every stored job."""
+    jobs = module.fine_tuning_jobs.values()
+    return {
+        "total_jobs": len(module.fine_tuning_jobs),
+        "successful_jobs": sum(job.get("status") == "succeeded" for job in jobs),
+        "failed_jobs": sum(job.get("status") == "failed" for job in jobs),
+        "active_jobs": sum(job.get("status") in ["running", "pending"] for job in jobs),
+        "total_models": len(module.fine_tuned_models),
+        "total_tokens_trained": sum(job.get("trained_tokens") or 0 for job in jobs)
+    }
+
+def test_usage_statistics_follow_job_transitions(finetuning):
+    """Repeated polls through every job outcome keep the counters equal to a full recount."""
+    jobs = finetuning.client.fine_tuning.jobs
+    succeeded = finetuning.create_fine_tuning_job('file-1')
+    cancelled = finetuning.create_fine_tuning_job('file-2')
+    failed = finetuning.create_fine_tuning_job('file-3')
+    assert finetuning.get_usage_statistics() == _recount(finetuning)
+
+    steps = [
+        (succeeded, ('running', None)),
+        (cancelled, ('running', None)),
+        (succeeded, ('running', None)),
+        (failed, ('failed', None)),
+        (succeeded, ('succeeded', 1200)),
+        (succeeded, ('succeeded', 1200)),
+        (failed, ('failed', None))
+    ]
+    for job_id, state in steps:
+        jobs.states[job_id] = state
+        finetuning.get_job_status(job_id)
+        assert finetuning.get_usage_statistics() == _recount(finetuning)
+
+    assert finetuning.cancel_job(cancelled) is True
+    finetuning.get_job_status(cancelled)
+    finetuning.get_job_status(cancelled)
+
+    stats = finetuning.get_usage_statistics()
+    assert stats == _recount(finetuning)
+    assert stats == {
+        "total_jobs": 3,
+        "successful_jobs": 1,
+        "failed_jobs": 1,
+        "active_jobs": 0,
+        "total_models": 0,
+        "total_tokens_trained": 1200
+    }
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v"]))
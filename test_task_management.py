@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+TaskManager Test Suite
+Tests queue ordering, cancellation, scheduling and export/import of tasks.
+"""
+
+import sys
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from modules import task_management
+
+@pytest.fixture
+def manager():
+    """A fresh TaskManager per test, so queue state never leaks between tests."""
+    manager = task_management.TaskManager()
+    yield manager
+    manager.shutdown()
+
+def _task(task_id, priority='medium', **extra):
+    """Build add_task input for a test task."""
+    return {
+        'id': task_id,
+        'description': f'Test task {task_id}',
+        'type': 'general',
+        'priority': priority,
+        'created_at': datetime.now().isoformat(),
+        'metadata': {},
+        **extra
+    }
+
+def _wait_for_status(manager, task_id, status, timeout=5.0):
+    """Poll until a task reaches a status; the scheduler runs on its own thread."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if manager.tasks[task_id].status == status:
+            return True
+        time.sleep(0.01)
+    return False
+
+def test_get_next_task_orders_by_priority_then_fifo(manager):
+    """Higher priority tasks come first; equal priorities keep insertion order."""
+    for task_id, priority in [('low-1', 'low'), ('med-1', 'medium'), ('high-1', 'high'),
+                              ('med-2', 'medium'), ('high-2', 'high')]:
+        manager.add_task(_task(task_id, priority))
+
+    order = [manager.get_next_task().id for _ in range(5)]
+
+    assert order == ['high-1', 'high-2', 'med-1', 'med-2', 'low-1']
+    assert manager.get_next_task() is None
+    assert manager.get_task_statistics()['active'] == 5
+
+def test_cancel_queued_task_is_skipped_when_popped(manager):
+    """A cancelled queued task is dropped from the index and never handed out."""
+    manager.add_task(_task('first', 'high'))
+    manager.add_task(_task('second'))
+
+    assert manager.cancel_task('first') is True
+    assert 'first' not in manager.tasks
+    assert manager.get_task_statistics()['queued'] == 1
+
+    assert manager.get_next_task().id == 'second'
+    assert manager.get_next_task() is None
+
+def test_cancel_scheduled_task(manager):
+    """A scheduled task can be cancelled and never reaches the queue."""
+    manager.schedule_task(_task('later'), datetime.now() + timedelta(hours=1))
+    assert manager.tasks['later'].status == 'scheduled'
+
+    assert manager.cancel_task('later') is True
+    assert manager.cancel_task('later') is False
+    assert manager.get_task_statistics()['scheduled'] == 0
+    assert manager.get_next_task() is None
+
+def test_rescheduled_task_ignores_cancelled_schedule(manager):
+    """A cancelled schedule entry does not promote a later task with the same id."""
+    manager.schedule_task(_task('again'), datetime.now() + timedelta(milliseconds=100))
+    assert manager.cancel_task('again') is True
+    manager.schedule_task(_task('again'), datetime.now() + timedelta(hours=1))
+
+    assert not _wait_for_status(manager, 'again', 'queued', timeout=0.5)
+    assert manager.tasks['again'].status == 'scheduled'
+    assert manager.tasks['again'].scheduled_at is not None
+
+def test_active_task_cannot_be_cancelled(manager):
+    """Only queued and scheduled tasks are cancellable."""
+    manager.add_task(_task('running'))
+    manager.get_next_task()
+
+    assert manager.cancel_task('running') is False
+    assert manager.tasks['running'].status == 'active'
+
+def test_scheduled_task_is_queued_when_due(manager):
+    """The scheduler moves a task to the queue once its time has come."""
+    manager.schedule_task(_task('soon'), datetime.now() + timedelta(milliseconds=200))
+    assert manager.get_next_task() is None
+
+    assert _wait_for_status(manager, 'soon', 'queued')
+    task = manager.get_next_task()
+    assert task.id == 'soon'
+    assert task.scheduled_at is None
+
+def test_complete_and_fail_only_apply_to_active_tasks(manager):
+    """Terminal transitions need an active task and happen once."""
+    manager.add_task(_task('done'))
+    manager.add_task(_task('broken'))
+    manager.add_task(_task('waiting'))
+    manager.get_next_task()
+    manager.get_next_task()
+
+    manager.complete_task('done', {'ok': True})
+    manager.fail_task('done', 'too late')
+    manager.fail_task('broken', 'boom')
+    manager.complete_task('waiting', {'ok': True})
+
+    stats = manager.get_task_statistics()
+    assert (stats['completed'], stats['failed'], stats['queued']) == (1, 1, 1)
+    assert manager.tasks['done'].metadata['result'] == {'ok': True}
+    assert 'error' not in manager.tasks['done'].metadata
+    assert manager.tasks['broken'].metadata['error'] == 'boom'
+
+@pytest.mark.parametrize('use_orjson', [True, False], ids=['orjson', 'json'])
+def test_export_import_round_trip(manager, tmp_path, monkeypatch, use_orjson):
+    """Exported scheduled, completed and failed tasks come back with their data."""
+    if use_orjson:
+        pytest.importorskip('orjson')
+    else:
+        monkeypatch.setattr(task_management, 'orjson', None)
+
+    scheduled_time = datetime.now() + timedelta(hours=1)
+    manager.schedule_task(_task('later', 'high'), scheduled_time)
+    manager.add_task(_task('done'))
+    manager.add_task(_task('broken', 'low'))
+    manager.get_next_task()
+    manager.get_next_task()
+    manager.complete_task('done', {'files': 3})
+    manager.fail_task('broken', 'boom')
+
+    export_file = tmp_path / 'tasks.json'
+    manager.export_tasks(str(export_file))
+
+    restored = task_management.TaskManager()
+    try:
+        restored.import_tasks(str(export_file))
+
+        stats = restored.get_task_statistics()
+        assert (stats['scheduled'], stats['completed'], stats['failed']) == (1, 1, 1)
+
+        later = restored.tasks['later']
+        assert later.status == 'scheduled'
+        assert later.priority == task_management.Priority.HIGH.value
+        assert later.scheduled_at == pytest.approx(scheduled_time.timestamp())
+
+        done = restored.tasks['done']
+        assert done.metadata['result'] == {'files': 3}
+        assert done.metadata['completed_at'] == pytest.approx(
+            manager.tasks['done'].metadata['completed_at'], abs=1e-3
+        )
+        assert restored.tasks['broken'].metadata['error'] == 'boom'
+        assert restored.tasks['broken'].created_at == pytest.approx(
+            manager.tasks['broken'].created_at, abs=1e-3
+        )
+    finally:
+        restored.shutdown()
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+VersionControlModule Test Suite
+Tests committing, status and history against throwaway git repositories,
+once with pygit2 and once through the git command line fallback.
+"""
+
+import sys
+import subprocess
+
+import pytest
+
+from modules import version_control as vc_module
+
+TASK = {'description': 'Test task', 'type': 'general'}
+
+def _git(path, *args):
+    """Run a git command in a test repository and return its output."""
+    return subprocess.run(['git', *args], cwd=path, check=True,
+                          capture_output=True, text=True).stdout
+
+def _commit_all(path, message):
+    """Stage everything in a test repository and commit it."""
+    _git(path, 'add', '-A')
+    _git(path, 'commit', '-q', '-m', message)
+
+@pytest.fixture(params=['pygit2', 'git'])
+def backend(request, monkeypatch):
+    """Run a test once on the pygit2 backend and once on the git fallback."""
+    if request.param == 'pygit2':
+        pytest.importorskip('pygit2')
+    else:
+        monkeypatch.setattr(vc_module, 'pygit2', None)
+    return request.param
+
+@pytest.fixture
+def repo(tmp_path):
+    """A repository on main with one commit of a.txt and b.txt."""
+    _git(tmp_path, 'init', '-q', '-b', 'main')
+    _git(tmp_path, 'config', 'user.name', 'Test User')
+    _git(tmp_path, 'config', 'user.email', 'test@example.com')
+    (tmp_path / 'a.txt').write_text('a\n')
+    (tmp_path / 'b.txt').write_text('b\n')
+    _commit_all(tmp_path, 'Initial commit')
+    return tmp_path
+
+@pytest.fixture
+def version_control(repo, backend):
+    """VersionControlModule for the test repository on the selected backend."""
+    module = vc_module.VersionControlModule(local_path=str(repo))
+    assert (module._libgit is not None) == (backend == 'pygit2')
+    return module
+
+def test_commit_new_modified_and_deleted_files(version_control, repo):
+    """A task commit records added, changed and removed files on the task branch and main."""
+    (repo / 'a.txt').unlink()
+    (repo / 'b.txt').write_text('b\nchanged\n')
+    (repo / 'c.txt').write_text('c\n')
+
+    result = version_control.commit_task_changes('abcdef123456', TASK)
+
+    assert result['status'] == 'success'
+    assert result['branch'] == 'task-abcdef12'
+    assert result['files_changed'] == 3
+    assert _git(repo, 'show', '--name-status', '--format=', 'main').split() == [
+        'D', 'a.txt', 'M', 'b.txt', 'A', 'c.txt'
+    ]
+    assert _git(repo, 'rev-parse', 'main', 'task-abcdef12').split() == [result['commit_hash']] * 2
+    assert _git(repo, 'symbolic-ref', 'HEAD').strip() == 'refs/heads/main'
+    assert _git(repo, 'status', '--porcelain') == ''
+
+def test_commit_without_configured_identity(version_control, repo, tmp_path_factory, monkeypatch):
+    """Task commits fall back to a default identity when git has none configured."""
+    home = tmp_path_factory.mktemp('home')
+    for name in ('HOME', 'XDG_CONFIG_HOME'):
+        monkeypatch.setenv(name, str(home))
+    monkeypatch.setenv('GIT_CONFIG_NOSYSTEM', '1')
+    for name in ('GIT_CONFIG_GLOBAL', 'GIT_AUTHOR_NAME', 'GIT_AUTHOR_EMAIL',
+                 'GIT_COMMITTER_NAME', 'GIT_COMMITTER_EMAIL', 'EMAIL'):
+        monkeypatch.delenv(name, raising=False)
+    _git(repo, 'config', '--unset', 'user.name')
+    _git(repo, 'config', '--unset', 'user.email')
+    (repo / 'c.txt').write_text('c\n')
+
+    result = version_control.commit_task_changes('abcdef123456', TASK)
+
+    assert result['status'] == 'success', result.get('error')
+    assert _git(repo, 'rev-parse', 'main').strip() == result['commit_hash']
+    assert _git(repo, 'log', '-1', '--format=%an', 'main').strip()
+
+def test_commit_keeps_author_and_committer_apart(version_control, repo, monkeypatch):
+    """The author identity is recorded separately from the committer's."""
+    monkeypatch.setenv('GIT_AUTHOR_NAME', 'Task Author')
+    monkeypatch.setenv('GIT_AUTHOR_EMAIL', 'author@example.com')
+    (repo / 'c.txt').write_text('c\n')
+
+    version_control.commit_task_changes('abcdef123456', TASK)
+
+    assert _git(repo, 'log', '-1', '--format=%an <%ae>|%cn <%ce>', 'main').strip() == (
+        'Task Author <author@example.com>|Test User <test@example.com>'
+    )
+
+def test_commit_without_isolation_goes_onto_main(version_control, repo):
+    """With isolate=False the commit lands on main and no task branch is created."""
+    (repo / 'c.txt').write_text('c\n')
+
+    result = version_control.commit_task_changes('abcdef123456', TASK, isolate=False)
+
+    assert result['status'] == 'success'
+    assert result['branch'] == 'main'
+    assert result['files_changed'] == 1
+    assert _git(repo, 'rev-parse', 'main').strip() == result['commit_hash']
+    assert _git(repo, 'branch', '--list', 'task-*') == ''
+
+def test_commit_on_diverged_task_branch_is_merged(version_control, repo):
+    """Once main has moved past the task branch, the next task commit is merged back."""
+    (repo / 'c.txt').write_text('c\n')
+    version_control.commit_task_changes('abcdef123456', TASK)
+    (repo / 'd.txt').write_text('d\n')
+    _commit_all(repo, 'Direct commit on main')
+    (repo / 'e.txt').write_text('e\n')
+
+    result = version_control.commit_task_changes('abcdef123456', TASK)
+
+    assert result['status'] == 'success'
+    assert result['files_changed'] == 1
+    parents = _git(repo, 'rev-list', '--parents', '-n', '1', 'main').split()[1:]
+    assert len(parents) == 2
+    assert _git(repo, 'symbolic-ref', 'HEAD').strip() == 'refs/heads/main'
+    assert _git(repo, 'status', '--porcelain') == ''
+
+def test_repository_status_counts(version_control, repo):
+    """Untracked, modified and staged paths are each counted once."""
+    (repo / 'new.txt').write_text('new\n')
+    (repo / 'a.txt').write_text('a\nchanged\n')
+    (repo / 'b.txt').write_text('b\nstaged\n')
+    (repo / 'staged.txt').write_text('staged\n')
+    _git(repo, 'add', 'b.txt', 'staged.txt')
+
+    status = version_control.get_repository_status()
+
+    assert status['status'] == 'initialized'
+    assert status['current_branch'] == 'main'
+    assert (status['untracked_files'], status['modified_files'], status['staged_files']) == (1, 1, 2)
+    assert status['remotes'] == []
+    assert status['last_commit']['message'] == 'Initial commit'
+    assert status['last_commit']['hash'] == _git(repo, 'rev-parse', 'HEAD').strip()
+
+def _make_merge_history(repo):
+    """Add a side branch and a main commit to the repository, then merge them."""
+    _git(repo, 'checkout', '-q', '-b', 'side')
+    (repo / 'a.txt').write_text('a\nside\n')
+    (repo / 's.txt').write_text('s\n')
+    _commit_all(repo, 'Side change')
+    _git(repo, 'checkout', '-q', 'main')
+    (repo / 'b.txt').unlink()
+    _commit_all(repo, 'Remove b')
+    _git(repo, 'merge', '-q', '--no-ff', '-m', 'Merge side', 'side')
+
+# Files each commit changed; merges count against their first parent
+MERGE_HISTORY = {'Merge side': 2, 'Remove b': 1, 'Side change': 2, 'Initial commit': 2}
+
+def test_commit_history(version_control, repo):
+    """Commit history counts changed files per commit, merges against their first parent."""
+    _make_merge_history(repo)
+
+    history = version_control.get_commit_history(limit=10)
+
+    assert {entry['message']: entry['files_changed'] for entry in history} == MERGE_HISTORY
+    assert history[0]['hash'] == _git(repo, 'rev-parse', 'HEAD').strip()
+    assert history[0]['author'] == 'Test User'
+    assert len(version_control.get_commit_history(limit=2)) == 2
+
+def test_commit_history_without_diff_merges(repo, monkeypatch):
+    """git older than 2.31 lacks --diff-merges, and falls back to per-commit stats."""
+    monkeypatch.setattr(vc_module, 'pygit2', None)
+    _make_merge_history(repo)
+    version_control = vc_module.VersionControlModule(local_path=str(repo))
+    current = version_control.get_commit_history(limit=10)
+    monkeypatch.setattr(type(version_control.repo.git), 'version_info', property(lambda git: (2, 25, 1)))
+
+    history = version_control.get_commit_history(limit=10)
+
+    assert {entry['message']: entry['files_changed'] for entry in history} == MERGE_HISTORY
+    assert history == current
+
+def test_file_history(version_control, repo):
+    """File history lists only the commits that touched the path, newest first."""
+    for n in range(3):
+        (repo / 'a.txt').write_text(f'a\n{n}\n')
+        _commit_all(repo, f'Change a {n}')
+    (repo / 'b.txt').write_text('b\nchanged\n')
+    _commit_all(repo, 'Change b')
+
+    history = version_control.get_file_history('a.txt')
+
+    assert [entry['message'] for entry in history] == [
+        'Change a 2', 'Change a 1', 'Change a 0', 'Initial commit'
+    ]
+    assert history[0]['hash'] == _git(repo, 'rev-parse', 'HEAD~1').strip()
+    assert history[0]['author'] == 'Test User'
+    assert [entry['message'] for entry in version_control.get_file_history('a.txt', limit=2)] == [
+        'Change a 2', 'Change a 1'
+    ]
+    assert version_control.get_file_history(str(repo / 'b.txt'))[0]['message'] == 'Change b'
+    assert version_control.get_file_history('missing.txt') == []
+
+def test_file_history_follows_the_merged_side(version_control, repo):
+    """A merge that kept one side's file hides the other side's changes, as git log does."""
+    _git(repo, 'checkout', '-q', '-b', 'side')
+    (repo / 'a.txt').write_text('a\nside\n')
+    _commit_all(repo, 'Side change')
+    _git(repo, 'checkout', '-q', 'main')
+    (repo / 'a.txt').write_text('a\nmain\n')
+    _commit_all(repo, 'Main change')
+    _git(repo, 'merge', '-q', '--no-ff', '-X', 'theirs', '-m', 'Merge side', 'side')
+
+    history = version_control.get_file_history('a.txt')
+
+    assert [entry['message'] for entry in history] == ['Side change', 'Initial commit']
+    assert [entry['hash'] for entry in history] == _git(repo, 'rev-list', 'HEAD', '--', 'a.txt').split()
+
+def test_sync_is_debounced_until_head_moves(repo, tmp_path_factory):
+    """A repeat sync is served from cache, until HEAD moves or force is given."""
+    clone = tmp_path_factory.mktemp('clone')
+    _git(clone, 'clone', '-q', str(repo), '.')
+    (repo / 'a.txt').write_text('a\nupstream\n')
+    _commit_all(repo, 'Upstream change')
+    version_control = vc_module.VersionControlModule(local_path=str(clone))
+
+    first = version_control.sync_with_remote()
+    cached = version_control.sync_with_remote()
+
+    assert (first['status'], first['pulled_changes']) == ('success', 1)
+    assert cached['cached'] is True
+    assert cached['pulled_changes'] == 0
+    assert cached['synced_at'] == first['synced_at']
+
+    _git(clone, 'reset', '-q', '--hard', 'HEAD~1')
+    resynced = version_control.sync_with_remote()
+    assert 'cached' not in resynced
+    assert resynced['pulled_changes'] == 1
+
+    assert 'cached' not in version_control.sync_with_remote(force=True)
+
+def test_backup_does_not_share_objects(repo, tmp_path_factory):
+    """A backup holds its own copies of the object files, not hardlinks to the source."""
+    backup = tmp_path_factory.mktemp('backup') / 'repo.git'
+    version_control = vc_module.VersionControlModule(local_path=str(repo))
+
+    result = version_control.backup_repository(str(backup))
+
+    assert result['status'] == 'success'
+    objects = [path for path in (backup / 'objects').rglob('*') if path.is_file()]
+    assert objects
+    assert all(path.stat().st_nlink == 1 for path in objects)
+    assert _git(backup, 'rev-parse', 'main') == _git(repo, 'rev-parse', 'main')
+
+def test_parse_commit_object():
+    """Raw commit objects yield the message, author and committer date with its offset."""
+    data = (
+        b'tree 4b825dc642cb6eb9a060e54bf8d69288fbee4904\n'
+        b'author Ana Example <ana@example.com> 1700000000 +0100\n'
+        b'committer Bo Example <bo@example.com> 1700003600 -0530\n'
+        b'\n'
+        b'Subject line\n\nBody text\n'
+    )
+
+    commit = vc_module._parse_commit_object('abc123', data)
+
+    assert commit == {
+        'hash': 'abc123',
+        'message': 'Subject line\n\nBody text',
+        'author': 'Ana Example',
+        'date': '2023-11-14T17:43:20-05:30'
+    }
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v"]))